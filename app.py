@@ -1,11 +1,6 @@
 import streamlit as st
 
-from dal.repository import JsonRepository
-from bll.unemployed_service import UnemployedService
-from bll.company_service import CompanyService
-from bll.vacancy_service import VacancyService
-from bll.resume_service import ResumeService
-
+from pl.container import get_container
 from pl.unemployed_view import show_unemployed_page
 from pl.companies_view import show_companies_page
 from pl.vacancies_view import show_vacancies_page
@@ -15,12 +10,13 @@ from pl.statistics_view import show_statistics_page
 
 def main():
     try:
-        repo = JsonRepository(filepath='dal/data.json')
+        container = get_container('dal/data.json')
         
-        unemployed_service = UnemployedService(repo)
-        company_service = CompanyService(repo)
-        vacancy_service = VacancyService(repo)
-        resume_service = ResumeService(repo, unemployed_service)
+        unemployed_service = container.unemployed_service
+        company_service = container.company_service
+        vacancy_service = container.vacancy_service
+        resume_service = container.resume_service
+        analytics_service = container.analytics_service
         
     except Exception as e:
         st.error(f"Помилка ініціалізації сервісу: {e}")
@@ -50,7 +46,7 @@ def main():
         "Вакансії": lambda: show_vacancies_page(vacancy_service, company_service),
         "Резюме": lambda: show_resumes_page(resume_service, unemployed_service),
         "Підбір (Matching)": lambda: show_matching_page(resume_service, vacancy_service, company_service, unemployed_service),
-        "Статистика": lambda: show_statistics_page(unemployed_service)
+        "Статистика": lambda: show_statistics_page(unemployed_service, analytics_service)
     }
 
     menu_selection = st.sidebar.radio(
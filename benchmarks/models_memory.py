@@ -0,0 +1,51 @@
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+
+from bll.models import Unemployed, get_new_id
+
+@dataclass
+class LegacyBaseModel:
+    id: str = field(default_factory=get_new_id)
+    version: int = 0
+
+@dataclass
+class LegacyPerson(LegacyBaseModel):
+    name: str = ""
+    surname: str = ""
+
+@dataclass
+class LegacyUnemployed(LegacyPerson):
+    qualifications: str = ""
+
+def measure(model_type, records):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    instances = [model_type(**record) for record in records]
+    elapsed = time.perf_counter() - started
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_instance = allocated / len(instances)
+    del instances
+    return per_instance, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Пам'ять та час створення моделей Unemployed")
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    records = [
+        {"id": str(i), "version": 0, "name": "Іван", "surname": "Петренко", "qualifications": "Python, SQL"}
+        for i in range(args.count)
+    ]
+
+    print(f"Записів: {args.count}")
+    for label, model_type in (("dataclass (__dict__)", LegacyUnemployed), ("dataclass(slots=True)", Unemployed)):
+        per_instance, elapsed = measure(model_type, records)
+        print(f"{label:<24} {per_instance:8.1f} байт/об'єкт  {elapsed:6.2f} с")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+from collections import Counter
+from typing import Any, Dict, List
+from dal.repository import IRepository
+from bll.models import parse_skills
+from bll.vacancy_service import VacancyService
+
+CHUNK_SIZE = 1000
+
+class AnalyticsService:
+    def __init__(self, repository: IRepository, vacancy_service: VacancyService):
+        self._repository = repository
+        self._vacancy_service = vacancy_service
+
+    def _skill_counts(self, collection: str) -> Counter:
+        counts = Counter()
+        for chunk in self._repository.iter_chunks(collection, CHUNK_SIZE):
+            for data in chunk:
+                counts.update(parse_skills(data.get("qualifications") or ""))
+        return counts
+
+    def _score_histogram(self, bins: int) -> List[Dict[str, Any]]:
+        counts = [0] * bins
+        for chunk in self._repository.iter_chunks("resumes", CHUNK_SIZE):
+            for data in chunk:
+                score = self._vacancy_service.best_match_score(parse_skills(data.get("qualifications") or ""))
+                counts[min(int(score * bins), bins - 1)] += 1
+        return [
+            {"from": i / bins, "to": (i + 1) / bins, "count": count}
+            for i, count in enumerate(counts)
+        ]
+
+    def get_skill_report(self, top_n: int = 10, bins: int = 10) -> Dict[str, Any]:
+        if top_n <= 0 or bins <= 0:
+            raise ValueError("top_n та bins мають бути додатними.")
+
+        supply = self._skill_counts("unemployed")
+        demand = self._skill_counts("vacancies")
+        gaps = Counter({skill: demand[skill] - supply[skill] for skill in demand if demand[skill] > supply[skill]})
+
+        return {
+            "top_supply": supply.most_common(top_n),
+            "top_demand": demand.most_common(top_n),
+            "gap": [
+                {"skill": skill, "demand": demand[skill], "supply": supply[skill], "gap": gap}
+                for skill, gap in gaps.most_common(top_n)
+            ],
+            "score_histogram": self._score_histogram(bins),
+        }
@@ -0,0 +1,71 @@
+import heapq
+import math
+import re
+from typing import Dict, List, Tuple
+from bll.entity_index import EntityIndex, EntityStore
+from bll.models import BaseModel
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+class BM25Index(EntityIndex):
+    def __init__(self, store: EntityStore, field_weights: Dict[str, float],
+                 k1: float = 1.2, b: float = 0.75):
+        super().__init__(store)
+        self._field_weights = field_weights
+        self.k1 = k1
+        self.b = b
+
+    def _clear(self) -> None:
+        self._lengths: Dict[str, float] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._total_length = 0.0
+
+    def _term_freqs(self, entity: BaseModel) -> Tuple[Dict[str, float], float]:
+        term_freqs: Dict[str, float] = {}
+        length = 0.0
+        for field, weight in self._field_weights.items():
+            tokens = tokenize(getattr(entity, field))
+            length += weight * len(tokens)
+            for token in tokens:
+                term_freqs[token] = term_freqs.get(token, 0.0) + weight
+        return term_freqs, length
+
+    def _index(self, entity: BaseModel) -> None:
+        term_freqs, length = self._term_freqs(entity)
+        self._lengths[entity.id] = length
+        self._total_length += length
+        for term, freq in term_freqs.items():
+            self._postings.setdefault(term, {})[entity.id] = freq
+
+    def _unindex(self, id: str) -> None:
+        self._total_length -= self._lengths.pop(id)
+        term_freqs, _ = self._term_freqs(self._entities[id])
+        for term in term_freqs:
+            docs = self._postings.get(term)
+            if docs is not None:
+                docs.pop(id, None)
+                if not docs:
+                    del self._postings[term]
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[BaseModel, float]]:
+        with self._reading():
+            total = len(self._entities)
+            if not total:
+                return []
+            average_length = self._total_length / total or 1.0
+
+            scores: Dict[str, float] = {}
+            for term in set(tokenize(query)):
+                docs = self._postings.get(term)
+                if not docs:
+                    continue
+                idf = math.log(1 + (total - len(docs) + 0.5) / (len(docs) + 0.5))
+                for id, freq in docs.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._lengths[id] / average_length)
+                    scores[id] = scores.get(id, 0.0) + idf * freq * (self.k1 + 1) / (freq + norm)
+
+            best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -self._order[item[0]]))
+            return [(self._entities[id], score) for id, score in best]
@@ -0,0 +1,238 @@
+import heapq
+import threading
+from array import array
+from collections import Counter
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+from bll.models import parse_skill_list
+
+COMPACT_MIN_DEAD_ROWS = 1024
+
+def _decrement(counter: Counter, key: int) -> None:
+    if counter[key] <= 1:
+        del counter[key]
+    else:
+        counter[key] -= 1
+
+class ColumnarStore:
+    def __init__(self, loader: Callable[[], List[Dict[str, Any]]], fields: List[str],
+                 skills_field: Optional[str] = "qualifications"):
+        self._loader = loader
+        self._fields = fields
+        self._skills_field = skills_field
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._changes = 0
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._changes += 1
+            self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        while True:
+            with self._lock:
+                if self._loaded:
+                    return
+                seen = self._changes
+            records = self._loader()
+            with self._lock:
+                if self._loaded:
+                    return
+                if self._changes != seen:
+                    continue
+                self._reset()
+                for data in records:
+                    self._append(data)
+                self._loaded = True
+                return
+
+    def _reset(self) -> None:
+        self._ids: List[str] = []
+        self._alive = bytearray()
+        self._row_of: Dict[str, int] = {}
+        self._position_of: Dict[str, int] = {}
+        self._next_position = 0
+        self._dead = 0
+        self._dictionaries: Dict[str, List[Any]] = {field: [] for field in self._fields}
+        self._codes: Dict[str, Dict[Any, int]] = {field: {} for field in self._fields}
+        self._columns: Dict[str, array] = {field: array('I') for field in self._fields}
+        self._skill_dictionary: List[str] = []
+        self._skill_codes_of: Dict[str, int] = {}
+        self._skill_offsets = array('I', [0])
+        self._skill_codes = array('I')
+        self._skill_totals: Counter = Counter()
+        self._skill_buckets: Dict[int, Tuple[Set[int], List[int]]] = {}
+        self._max_skill_count = 0
+        self._value_totals: Dict[str, Counter] = {field: Counter() for field in self._fields}
+
+    def _encode(self, field: str, value: Any) -> int:
+        codes = self._codes[field]
+        code = codes.get(value)
+        if code is None:
+            code = len(self._dictionaries[field])
+            codes[value] = code
+            self._dictionaries[field].append(value)
+        return code
+
+    def _encode_skill(self, skill: str) -> int:
+        code = self._skill_codes_of.get(skill)
+        if code is None:
+            code = len(self._skill_dictionary)
+            self._skill_codes_of[skill] = code
+            self._skill_dictionary.append(skill)
+        return code
+
+    def _append(self, data: Dict[str, Any]) -> None:
+        id = data.get('id')
+        if id in self._row_of:
+            self._kill(id)
+        else:
+            self._position_of[id] = self._next_position
+            self._next_position += 1
+        self._row_of[id] = len(self._ids)
+        self._ids.append(id)
+        self._alive.append(1)
+        for field in self._fields:
+            code = self._encode(field, data.get(field))
+            self._columns[field].append(code)
+            self._value_totals[field][code] += 1
+        if self._skills_field:
+            skills = parse_skill_list(data.get(self._skills_field) or "")
+            codes = sorted([self._encode_skill(skill) for skill in skills])
+            self._skill_codes.extend(codes)
+            for code in codes:
+                self._bump_skill(code, 1)
+        self._skill_offsets.append(len(self._skill_codes))
+
+    def _kill(self, id: str) -> None:
+        row = self._row_of.pop(id, None)
+        if row is None:
+            return
+        self._alive[row] = 0
+        self._dead += 1
+        for field in self._fields:
+            _decrement(self._value_totals[field], self._columns[field][row])
+        for code in self._skill_codes[self._skill_offsets[row]:self._skill_offsets[row + 1]]:
+            self._bump_skill(code, -1)
+
+    def _bump_skill(self, code: int, delta: int) -> None:
+        count = self._skill_totals.get(code, 0)
+        if count:
+            members, _ = self._skill_buckets[count]
+            members.discard(code)
+            if not members:
+                del self._skill_buckets[count]
+        count += delta
+        if count:
+            self._skill_totals[code] = count
+            members, heap = self._skill_buckets.setdefault(count, (set(), []))
+            members.add(code)
+            heapq.heappush(heap, code)
+            if len(heap) > 2 * len(members) + 16:
+                heap[:] = members
+                heapq.heapify(heap)
+        else:
+            del self._skill_totals[code]
+        if count > self._max_skill_count or self._max_skill_count not in self._skill_buckets:
+            self._max_skill_count = count
+
+    def _compact(self) -> None:
+        alive_rows = [row for row in range(len(self._ids)) if self._alive[row]]
+        self._ids = [self._ids[row] for row in alive_rows]
+        self._row_of = {id: row for row, id in enumerate(self._ids)}
+        self._alive = bytearray(b'\x01' * len(alive_rows))
+        for field in self._fields:
+            column = self._columns[field]
+            self._columns[field] = array('I', (column[row] for row in alive_rows))
+        offsets = array('I', [0])
+        codes = array('I')
+        for row in alive_rows:
+            codes.extend(self._skill_codes[self._skill_offsets[row]:self._skill_offsets[row + 1]])
+            offsets.append(len(codes))
+        self._skill_offsets = offsets
+        self._skill_codes = codes
+        self._dead = 0
+
+    def apply_change(self, action: str, entities: List[Dict[str, Any]], model_type=None) -> None:
+        with self._lock:
+            self._changes += 1
+            if not self._loaded:
+                return
+            for data in entities:
+                if action == "delete":
+                    self._kill(data.get('id'))
+                    self._position_of.pop(data.get('id'), None)
+                else:
+                    self._append(data)
+            if self._dead >= COMPACT_MIN_DEAD_ROWS and self._dead * 2 > len(self._ids):
+                self._compact()
+
+    def count(self) -> int:
+        self._ensure_loaded()
+        with self._lock:
+            return len(self._ids) - self._dead
+
+    def value_counts(self, field: str) -> Counter:
+        self._ensure_loaded()
+        with self._lock:
+            dictionary = self._dictionaries[field]
+            return Counter({dictionary[code]: n for code, n in self._value_totals[field].items()})
+
+    def skill_counts(self) -> Counter:
+        self._ensure_loaded()
+        with self._lock:
+            dictionary = self._skill_dictionary
+            return Counter({dictionary[code]: n for code, n in self._skill_totals.items()})
+
+    def top_skill(self) -> Optional[Tuple[str, int]]:
+        self._ensure_loaded()
+        with self._lock:
+            if not self._max_skill_count:
+                return None
+            members, heap = self._skill_buckets[self._max_skill_count]
+            while heap[0] not in members:
+                heapq.heappop(heap)
+            code = heap[0]
+            return self._skill_dictionary[code], self._max_skill_count
+
+    def _aggregates(self) -> Tuple[int, Counter, Dict[str, Counter]]:
+        return self.count(), self.skill_counts(), {field: self.value_counts(field) for field in self._fields}
+
+    def recompute(self) -> bool:
+        running = self._aggregates()
+        self.invalidate()
+        return running == self._aggregates()
+
+    def ids_where(self, field: str, value: Any) -> List[str]:
+        self._ensure_loaded()
+        with self._lock:
+            code = self._codes[field].get(value)
+            if code is None:
+                return []
+            column = self._columns[field]
+            alive = self._alive
+            ids = [self._ids[row] for row in range(len(column)) if column[row] == code and alive[row]]
+            return sorted(ids, key=self._position_of.__getitem__)
+
+    def match(self, query_skills: FrozenSet[str], min_match: float = 0.25) -> List[Tuple[str, float]]:
+        self._ensure_loaded()
+        with self._lock:
+            query_codes = {self._skill_codes_of[s] for s in query_skills if s in self._skill_codes_of}
+            if not query_skills:
+                return [(id, 0.0) for id in self._alive_ids()] if min_match <= 0 else []
+
+            offsets = self._skill_offsets
+            codes = self._skill_codes
+            results = []
+            for row, id in enumerate(self._ids):
+                if not self._alive[row]:
+                    continue
+                shared = sum(1 for code in codes[offsets[row]:offsets[row + 1]] if code in query_codes)
+                score = shared / len(query_skills)
+                if score >= min_match:
+                    results.append((id, score))
+            return sorted(results, key=lambda item: (-item[1], self._position_of[item[0]]))
+
+    def _alive_ids(self) -> List[str]:
+        ids = [id for row, id in enumerate(self._ids) if self._alive[row]]
+        return sorted(ids, key=self._position_of.__getitem__)
@@ -0,0 +1,157 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from bll.models import BaseModel
+
+class EntityStore:
+    def __init__(self, loader: Callable[[], List[BaseModel]]):
+        self._loader = loader
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._changes = 0
+        self._generation = 0
+        self._entities: Dict[str, BaseModel] = {}
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        self._indexes: List["EntityIndex"] = []
+
+    def attach(self, index: "EntityIndex") -> None:
+        with self._lock:
+            self._indexes.append(index)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._changes += 1
+            self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        while True:
+            with self._lock:
+                if self._loaded:
+                    return
+                seen = self._changes
+            loaded = self._loader()
+            with self._lock:
+                if self._loaded:
+                    return
+                if self._changes != seen:
+                    continue
+                self._entities = {}
+                self._order = {}
+                self._next_order = 0
+                for entity in loaded:
+                    self._put(entity)
+                self._generation += 1
+                self._loaded = True
+                return
+
+    def _built_indexes(self) -> List["EntityIndex"]:
+        return [index for index in self._indexes if index._built_generation == self._generation]
+
+    def _put(self, entity: BaseModel, indexes: List["EntityIndex"] = ()) -> None:
+        if entity.id in self._entities:
+            for index in indexes:
+                index._unindex(entity.id)
+        else:
+            self._order[entity.id] = self._next_order
+            self._next_order += 1
+        self._entities[entity.id] = entity
+        for index in indexes:
+            index._index(entity)
+
+    def _remove(self, id: str, indexes: List["EntityIndex"] = ()) -> None:
+        if id not in self._entities:
+            return
+        for index in indexes:
+            index._unindex(id)
+        del self._entities[id]
+        del self._order[id]
+
+    def apply_change(self, action: str, entities: List[Dict[str, Any]], model_type) -> None:
+        with self._lock:
+            self._changes += 1
+            if not self._loaded:
+                return
+            indexes = self._built_indexes()
+            for data in entities:
+                if action == "delete":
+                    self._remove(data.get('id'), indexes)
+                else:
+                    self._put(model_type(**data), indexes)
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        with self._lock:
+            return len(self._entities)
+
+    def get(self, id: str) -> Optional[BaseModel]:
+        with self._lock:
+            return self._entities.get(id)
+
+    def entities(self) -> Iterator[BaseModel]:
+        self._ensure_loaded()
+        with self._lock:
+            return iter(list(self._entities.values()))
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def snapshot(self) -> Tuple[int, List[Tuple[int, BaseModel]]]:
+        self._ensure_loaded()
+        with self._lock:
+            return self._generation, [(self._order[id], entity) for id, entity in self._entities.items()]
+
+    def ordered(self, ids: Iterable[str]) -> List[Tuple[int, BaseModel]]:
+        self._ensure_loaded()
+        with self._lock:
+            return [(self._order[id], self._entities[id]) for id in ids if id in self._entities]
+
+class EntityIndex:
+    def __init__(self, store: EntityStore):
+        self._store = store
+        self._built_generation = None
+        store.attach(self)
+
+    @property
+    def _entities(self) -> Dict[str, BaseModel]:
+        return self._store._entities
+
+    @property
+    def _order(self) -> Dict[str, int]:
+        return self._store._order
+
+    def _clear(self) -> None:
+        pass
+
+    def _index(self, entity: BaseModel) -> None:
+        pass
+
+    def _unindex(self, id: str) -> None:
+        pass
+
+    def _rebuild(self, entities: Iterable[BaseModel]) -> None:
+        self._clear()
+        for entity in entities:
+            self._index(entity)
+
+    @contextmanager
+    def _reading(self):
+        while True:
+            self._store._ensure_loaded()
+            with self._store._lock:
+                if not self._store._loaded:
+                    continue
+                if self._built_generation != self._store._generation:
+                    self._rebuild(self._store._entities.values())
+                    self._built_generation = self._store._generation
+                yield
+                return
+
+    def entities(self) -> Iterator[BaseModel]:
+        with self._reading():
+            return iter(list(self._entities.values()))
+
+    def _in_order(self, ids) -> List[BaseModel]:
+        return [self._entities[id] for id in sorted(ids, key=self._order.__getitem__)]
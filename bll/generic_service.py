@@ -1,7 +1,10 @@
-from typing import TypeVar, Generic, List, Type
+import threading
+from typing import Any, Callable, Dict, TypeVar, Generic, Iterator, List, Optional, Type
 from dataclasses import asdict, is_dataclass
 from dal.repository import IRepository
 from bll.models import BaseModel
+from bll.entity_index import EntityStore
+from bll.sorted_index import SortedIndex
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -10,26 +13,105 @@ class GenericService(Generic[T]):
         self._repository = repository
         self._collection = collection
         self._model_type = model_type
+        self._indexes: List[Any] = []
+        self._sorted_indexes: Dict[Optional[str], SortedIndex] = {}
+        self._sorted_indexes_lock = threading.Lock()
+        self._entity_store = self._add_index(EntityStore(lambda: self.get_all()))
+        repository.subscribe(self._on_repository_change)
+
+    def _add_index(self, index, collection: Optional[str] = None, model_type: Optional[Type] = None):
+        self._indexes.append((collection or self._collection, model_type or self._model_type, index))
+        return index
+
+    def _on_repository_change(self, collection: Optional[str], action: str, entities: List[Dict[str, Any]]) -> None:
+        for index_collection, model_type, index in self._indexes:
+            if action == "reset":
+                index.invalidate()
+            elif collection == index_collection:
+                index.apply_change(action, entities, model_type)
+
+    @property
+    def model_type(self) -> Type[T]:
+        return self._model_type
+
+    def _check_entity(self, entity: T) -> None:
+        if not is_dataclass(entity):
+            raise TypeError("Entity must be a dataclass instance.")
+
+    def _prepare_new(self, entity: T) -> None:
+        self._check_entity(entity)
 
     def get_all(self) -> List[T]:
         all_data = self._repository.get_all(self._collection)
         return [self._model_type(**data) for data in all_data]
 
+    def iter_chunks(self, chunk_size: int) -> Iterator[List[T]]:
+        for chunk in self._repository.iter_chunks(self._collection, chunk_size):
+            yield [self._model_type(**data) for data in chunk]
+
+    def _get_sorted_index(self, sort_by: Optional[str]) -> SortedIndex:
+        with self._sorted_indexes_lock:
+            index = self._sorted_indexes.get(sort_by)
+            if index is None:
+                index = SortedIndex(self._entity_store, sort_by)
+                self._sorted_indexes[sort_by] = index
+            return index
+
+    def query(self, sort_by: Optional[str] = None, where: Optional[Callable[[T], bool]] = None,
+              limit: Optional[int] = None, offset: int = 0) -> Iterator[T]:
+        return self._get_sorted_index(sort_by).iterate(where, offset, limit)
+
+    def count(self) -> int:
+        return len(self._entity_store)
+
     def get_by_id(self, id: str) -> T:
         data = self._repository.get_by_id(self._collection, id)
         return self._model_type(**data)
 
+    def get_many(self, ids: List[str]) -> Dict[str, T]:
+        all_data = self._repository.get_many(self._collection, list(ids))
+        return {id: self._model_type(**data) for id, data in all_data.items()}
+
+    def find_by_field(self, field: str, value: Any) -> List[T]:
+        all_data = self._repository.find_by_field(self._collection, field, value)
+        return [self._model_type(**data) for data in all_data]
+
     def add(self, entity: T) -> T:
-        if not is_dataclass(entity):
-            raise TypeError("Entity must be a dataclass instance.")
+        self._prepare_new(entity)
         self._repository.add(self._collection, asdict(entity))
         return entity
 
+    def _next_version(self, entity: T) -> dict:
+        data = asdict(entity)
+        data['version'] = entity.version + 1
+        return data
+
     def update(self, entity: T) -> T:
-        if not is_dataclass(entity):
-            raise TypeError("Entity must be a dataclass instance.")
-        self._repository.update(self._collection, asdict(entity))
+        self._check_entity(entity)
+        data = self._next_version(entity)
+        self._repository.update(self._collection, data)
+        entity.version = data['version']
         return entity
 
     def delete(self, id: str) -> None:
-        self._repository.delete(self._collection, id)
\ No newline at end of file
+        self._repository.delete(self._collection, id)
+
+    def add_many(self, entities: List[T]) -> List[T]:
+        entities = list(entities)
+        for entity in entities:
+            self._prepare_new(entity)
+        self._repository.add_many(self._collection, [asdict(entity) for entity in entities])
+        return entities
+
+    def update_many(self, entities: List[T]) -> List[T]:
+        entities = list(entities)
+        for entity in entities:
+            self._check_entity(entity)
+        all_data = [self._next_version(entity) for entity in entities]
+        self._repository.update_many(self._collection, all_data)
+        for entity, data in zip(entities, all_data):
+            entity.version = data['version']
+        return entities
+
+    def delete_many(self, ids: List[str]) -> None:
+        self._repository.delete_many(self._collection, list(ids))
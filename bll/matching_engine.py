@@ -0,0 +1,129 @@
+import heapq
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = None
+    sparse = None
+
+MATCHING_BACKENDS = ("auto", "sparse", "postings")
+SPARSE_BLOCK_ROWS = 5000
+
+def _build_vocabulary(*skill_lists: List[FrozenSet[str]]) -> Dict[str, int]:
+    vocabulary: Dict[str, int] = {}
+    for skill_list in skill_lists:
+        for skills in skill_list:
+            for skill in skills:
+                vocabulary.setdefault(skill, len(vocabulary))
+    return vocabulary
+
+def _to_matrix(skill_list: List[FrozenSet[str]], vocabulary: Dict[str, int]):
+    indptr = [0]
+    indices = []
+    for skills in skill_list:
+        indices.extend(vocabulary[skill] for skill in skills)
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.int32)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(skill_list), len(vocabulary)))
+
+def _sparse_counts(rows: List[FrozenSet[str]], columns: List[FrozenSet[str]],
+                   block_rows: int = SPARSE_BLOCK_ROWS) -> Iterator[Tuple[int, Dict[int, int]]]:
+    vocabulary = _build_vocabulary(rows, columns)
+    transposed = _to_matrix(columns, vocabulary).T.tocsc()
+    for offset in range(0, len(rows), block_rows):
+        product = (_to_matrix(rows[offset:offset + block_rows], vocabulary) @ transposed).tocsr()
+        for i in range(product.shape[0]):
+            start, end = product.indptr[i], product.indptr[i + 1]
+            yield offset + i, dict(zip(product.indices[start:end].tolist(), product.data[start:end].tolist()))
+
+def _posting_counts(rows: List[FrozenSet[str]], columns: List[FrozenSet[str]]) -> Iterator[Tuple[int, Dict[int, int]]]:
+    postings: Dict[str, List[int]] = {}
+    for j, skills in enumerate(columns):
+        for skill in skills:
+            postings.setdefault(skill, []).append(j)
+    for i, skills in enumerate(rows):
+        counts: Dict[int, int] = {}
+        for skill in skills:
+            for j in postings.get(skill, ()):
+                counts[j] = counts.get(j, 0) + 1
+        yield i, counts
+
+def intersection_counts(rows: List[FrozenSet[str]], columns: List[FrozenSet[str]],
+                        backend: str = "auto") -> Iterator[Tuple[int, Dict[int, int]]]:
+    if backend not in MATCHING_BACKENDS:
+        raise ValueError(f"Невідомий режим підбору '{backend}', підтримуються: {', '.join(MATCHING_BACKENDS)}")
+    if backend == "sparse" and sparse is None:
+        raise ImportError("Режим 'sparse' потребує встановлених numpy та scipy.")
+    if backend != "postings" and sparse is not None and rows and columns:
+        return _sparse_counts(rows, columns)
+    return _posting_counts(rows, columns)
+
+def score_shard(query_skills: FrozenSet[str], shard: List[Tuple[int, FrozenSet[str]]],
+                min_match: float, k: Optional[int], excluded: FrozenSet[int] = frozenset()) -> List[Tuple[float, int]]:
+    scored = []
+    for position, skills in shard:
+        if position in excluded:
+            continue
+        score = len(query_skills & skills) / len(query_skills) if query_skills else 0.0
+        if score >= min_match:
+            scored.append((score, position))
+    return top_scored(scored, k)
+
+def top_scored(scored: Iterable[Tuple[float, int]], k: Optional[int]) -> List[Tuple[float, int]]:
+    key = lambda item: (item[0], -item[1])
+    if k is None:
+        return sorted(scored, key=key, reverse=True)
+    return heapq.nlargest(k, scored, key=key)
+
+_resident_shard: List[Tuple[int, FrozenSet[str]]] = []
+
+def _load_shard(shard: List[Tuple[int, FrozenSet[str]]]) -> None:
+    global _resident_shard
+    _resident_shard = shard
+
+def score_resident(query_skills: FrozenSet[str], min_match: float, k: Optional[int],
+                   excluded: FrozenSet[int]) -> List[Tuple[float, int]]:
+    return score_shard(query_skills, _resident_shard, min_match, k, excluded)
+
+class ShardedScorer:
+    def __init__(self, candidates: List[Tuple[int, FrozenSet[str]]], shards: int):
+        size = max(1, -(-len(candidates) // shards))
+        self._executors = [
+            ProcessPoolExecutor(max_workers=1, initializer=_load_shard, initargs=(candidates[start:start + size],))
+            for start in range(0, len(candidates), size)
+        ]
+        self._lock = threading.Lock()
+        self._users = 0
+        self._closed = False
+
+    def acquire(self) -> None:
+        with self._lock:
+            self._users += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._users -= 1
+            if not (self._closed and self._users == 0):
+                return
+        self._shutdown()
+
+    def score(self, query_skills: FrozenSet[str], min_match: float, k: Optional[int],
+              excluded: FrozenSet[int] = frozenset()) -> List[Tuple[float, int]]:
+        futures = [executor.submit(score_resident, query_skills, min_match, k, excluded) for executor in self._executors]
+        return top_scored([item for future in futures for item in future.result()], k)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            if self._users:
+                return
+        self._shutdown()
+
+    def _shutdown(self) -> None:
+        for executor in self._executors:
+            executor.shutdown()
+        self._executors = []
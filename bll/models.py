@@ -1,37 +1,59 @@
 from dataclasses import dataclass, field
+from typing import FrozenSet, List
 from uuid import uuid4
 
 def get_new_id():
     return str(uuid4())
 
-@dataclass
-class BaseModel:
+def parse_skills(qualifications: str) -> FrozenSet[str]:
+    return frozenset(s.strip().lower() for s in qualifications.split(',') if s.strip())
+
+def parse_skill_list(qualifications: str) -> List[str]:
+    return list(dict.fromkeys(s.strip().lower() for s in qualifications.split(',') if s.strip()))
+
+class CacheSlots:
+    __slots__ = ('_skills_cache',)
+
+class SkillsMixin:
+    __slots__ = ()
+
+    @property
+    def skills(self) -> FrozenSet[str]:
+        cached = getattr(self, '_skills_cache', None)
+        if cached is None or cached[0] is not self.qualifications:
+            cached = (self.qualifications, parse_skills(self.qualifications))
+            object.__setattr__(self, '_skills_cache', cached)
+        return cached[1]
+
+@dataclass(slots=True)
+class BaseModel(CacheSlots):
     id: str = field(default_factory=get_new_id)
+    version: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class Person(BaseModel):
     name: str = ""
     surname: str = ""
 
-@dataclass
-class Unemployed(Person):
+@dataclass(slots=True)
+class Unemployed(SkillsMixin, Person):
     qualifications: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class Company(BaseModel):
     name: str = ""
 
-@dataclass
-class Document(BaseModel):
+@dataclass(slots=True)
+class Document(SkillsMixin, BaseModel):
     title: str = ""
     qualifications: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class Vacancy(Document):
     company_id: str = ""
     description: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class Resume(Document):
     unemployed_id: str = ""
-    skills_description: str = ""
\ No newline at end of file
+    skills_description: str = ""
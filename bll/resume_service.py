@@ -10,15 +10,13 @@ class ResumeService(GenericService[Resume]):
         super().__init__(repository, "resumes", Resume)
         self._unemployed_service = unemployed_service
 
-    def add(self, entity: Resume) -> Resume:
+    def _prepare_new(self, entity: Resume) -> None:
+        super()._prepare_new(entity)
         if not entity.title or not entity.unemployed_id:
             raise ValidationException("Назва та ID безробітного є обов'язковими.")
         
         person = self._unemployed_service.get_by_id(entity.unemployed_id)
         entity.qualifications = person.qualifications
-        
-        return super().add(entity)
 
     def get_resumes_for_unemployed(self, unemployed_id: str) -> List[Resume]:
-        all_resumes = self.get_all()
-        return [r for r in all_resumes if r.unemployed_id == unemployed_id]
\ No newline at end of file
+        return self.find_by_field("unemployed_id", unemployed_id)
\ No newline at end of file
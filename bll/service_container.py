@@ -0,0 +1,25 @@
+from dal.repository import IRepository, JsonRepository
+from bll.unemployed_service import UnemployedService
+from bll.company_service import CompanyService
+from bll.vacancy_service import VacancyService
+from bll.resume_service import ResumeService
+from bll.analytics_service import AnalyticsService
+
+class ServiceContainer:
+    def __init__(self, repository: IRepository):
+        self.repository = repository
+        self.unemployed_service = UnemployedService(repository)
+        self.company_service = CompanyService(repository)
+        self.vacancy_service = VacancyService(repository)
+        self.resume_service = ResumeService(repository, self.unemployed_service)
+        self.analytics_service = AnalyticsService(repository, self.vacancy_service)
+
+    @classmethod
+    def from_json(cls, filepath: str, **options) -> "ServiceContainer":
+        return cls(JsonRepository(filepath=filepath, use_cache=True, **options))
+
+    def refresh(self) -> None:
+        self.repository.refresh()
+
+    def close(self) -> None:
+        self.vacancy_service.close()
@@ -0,0 +1,144 @@
+import hashlib
+import heapq
+import math
+from array import array
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+def _hash_pair(item: str) -> Tuple[int, int]:
+    digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+class CountMinSketch:
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01):
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon та delta мають бути в межах (0, 1).")
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.total = 0
+        self._rows = [array('q', bytes(8 * self.width)) for _ in range(self.depth)]
+
+    def _cells(self, item: str):
+        h1, h2 = _hash_pair(item)
+        for i, row in enumerate(self._rows):
+            yield row, (h1 + i * h2) % self.width
+
+    def add(self, item: str, count: int = 1) -> None:
+        self.total += count
+        for row, cell in self._cells(item):
+            row[cell] += count
+
+    def estimate(self, item: str) -> int:
+        return min(row[cell] for row, cell in self._cells(item))
+
+    def error_bound(self) -> float:
+        return self.epsilon * self.total
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Об'єднувати можна лише скетчі однакового розміру.")
+        for row, other_row in zip(self._rows, other._rows):
+            for cell in range(self.width):
+                row[cell] += other_row[cell]
+        self.total += other.total
+        return self
+
+class SpaceSaving:
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Місткість має бути додатною.")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: Dict[Hashable, int] = {}
+        self._errors: Dict[Hashable, int] = {}
+        self._heap: List[Tuple[int, Hashable]] = []
+
+    def _min_count(self) -> int:
+        while True:
+            count, item = self._heap[0]
+            current = self._counts.get(item)
+            if current == count:
+                return count
+            heapq.heappop(self._heap)
+            if current is not None:
+                heapq.heappush(self._heap, (current, item))
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        self.total += count
+        if item in self._counts:
+            self._counts[item] += count
+            return
+        if len(self._counts) < self.capacity:
+            self._counts[item] = count
+            self._errors[item] = 0
+            heapq.heappush(self._heap, (count, item))
+            return
+        floor = self._min_count()
+        _, evicted = heapq.heappop(self._heap)
+        del self._counts[evicted]
+        del self._errors[evicted]
+        self._counts[item] = floor + count
+        self._errors[item] = floor
+        heapq.heappush(self._heap, (floor + count, item))
+
+    def update(self, items: Iterable[Hashable]) -> None:
+        for item in items:
+            self.add(item)
+
+    def error_bound(self) -> float:
+        return self.total / self.capacity
+
+    def _floor(self) -> int:
+        return self._min_count() if len(self._counts) >= self.capacity else 0
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        own_floor, other_floor = self._floor(), other._floor()
+        counts, errors = {}, {}
+        for item in self._counts.keys() | other._counts.keys():
+            counts[item] = self._counts.get(item, own_floor) + other._counts.get(item, other_floor)
+            errors[item] = self._errors.get(item, own_floor) + other._errors.get(item, other_floor)
+        kept = heapq.nlargest(self.capacity, counts, key=counts.get)
+        self._counts = {item: counts[item] for item in kept}
+        self._errors = {item: errors[item] for item in kept}
+        self._heap = [(count, item) for item, count in self._counts.items()]
+        heapq.heapify(self._heap)
+        self.total += other.total
+        return self
+
+    def top_k(self, k: int) -> List[Tuple[Hashable, int]]:
+        return heapq.nlargest(k, self._counts.items(), key=lambda item: item[1])
+
+    def count(self, item: Hashable) -> int:
+        return self._counts.get(item, self._floor())
+
+    def error(self, item: Hashable) -> int:
+        return self._errors.get(item, self._floor())
+
+class SkillSketch:
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01):
+        self.heavy_hitters = SpaceSaving(math.ceil(1 / epsilon))
+        self.frequencies = CountMinSketch(epsilon, delta)
+        self.documents = 0
+
+    def add(self, skills: Iterable[str]) -> None:
+        self.documents += 1
+        for skill in skills:
+            self.heavy_hitters.add(skill)
+            self.frequencies.add(skill)
+
+    def merge(self, other: "SkillSketch") -> "SkillSketch":
+        self.heavy_hitters.merge(other.heavy_hitters)
+        self.frequencies.merge(other.frequencies)
+        self.documents += other.documents
+        return self
+
+    def estimate(self, skill: str) -> int:
+        return min(self.frequencies.estimate(skill), self.heavy_hitters.count(skill))
+
+    def top_k(self, k: int) -> List[Tuple[str, int]]:
+        candidates = [(skill, self.estimate(skill)) for skill, _ in self.heavy_hitters.top_k(self.heavy_hitters.capacity)]
+        return heapq.nlargest(k, candidates, key=lambda item: item[1])
+
+    def error_bound(self) -> float:
+        return min(self.heavy_hitters.error_bound(), self.frequencies.error_bound())
@@ -0,0 +1,30 @@
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple
+from bll.entity_index import EntityIndex
+from bll.models import Document
+
+class SkillIndex(EntityIndex):
+    def _clear(self) -> None:
+        self._postings: Dict[str, Set[str]] = {}
+
+    def _index(self, entity: Document) -> None:
+        for skill in entity.skills:
+            self._postings.setdefault(skill, set()).add(entity.id)
+
+    def _unindex(self, id: str) -> None:
+        for skill in self._entities[id].skills:
+            ids = self._postings.get(skill)
+            if ids is not None:
+                ids.discard(id)
+                if not ids:
+                    del self._postings[skill]
+
+    def all(self) -> Iterator[Tuple[Document, FrozenSet[str]]]:
+        for entity in self.entities():
+            yield entity, entity.skills
+
+    def candidates(self, skills: Iterable[str]) -> List[Tuple[Document, FrozenSet[str]]]:
+        with self._reading():
+            ids: Set[str] = set()
+            for skill in skills:
+                ids.update(self._postings.get(skill, ()))
+            return [(entity, entity.skills) for entity in self._in_order(ids)]
@@ -0,0 +1,45 @@
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from bll.entity_index import EntityIndex, EntityStore
+from bll.models import BaseModel
+
+class SortedIndex(EntityIndex):
+    def __init__(self, store: EntityStore, field: Optional[str] = None):
+        super().__init__(store)
+        self._field = field
+
+    def _clear(self) -> None:
+        self._keys: List[Tuple[Any, ...]] = []
+        self._key_of: Dict[str, Tuple[Any, ...]] = {}
+
+    def _key(self, entity: BaseModel) -> Tuple[Any, ...]:
+        order = self._order[entity.id]
+        return (getattr(entity, self._field), order, entity.id) if self._field else (order, entity.id)
+
+    def _index(self, entity: BaseModel) -> None:
+        key = self._key(entity)
+        self._key_of[entity.id] = key
+        insort(self._keys, key)
+
+    def _rebuild(self, entities: Iterable[BaseModel]) -> None:
+        self._key_of = {entity.id: self._key(entity) for entity in entities}
+        self._keys = sorted(self._key_of.values())
+
+    def _unindex(self, id: str) -> None:
+        key = self._key_of.pop(id)
+        position = bisect_left(self._keys, key)
+        del self._keys[position]
+
+    def __len__(self) -> int:
+        with self._reading():
+            return len(self._keys)
+
+    def iterate(self, where: Optional[Callable[[BaseModel], bool]] = None,
+                offset: int = 0, limit: Optional[int] = None) -> Iterator[BaseModel]:
+        stop = offset + limit if limit is not None else None
+        with self._reading():
+            if where is None:
+                return iter([self._entities[key[-1]] for key in self._keys[offset:stop]])
+            entities = [self._entities[key[-1]] for key in self._keys]
+        return islice((entity for entity in entities if where(entity)), offset, stop)
@@ -0,0 +1,51 @@
+from typing import Dict, List, Set
+from bll.entity_index import EntityIndex, EntityStore
+from bll.models import BaseModel
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class TrigramIndex(EntityIndex):
+    def __init__(self, store: EntityStore, fields: List[str]):
+        super().__init__(store)
+        self._fields = fields
+
+    def _clear(self) -> None:
+        self._postings: Dict[str, Set[str]] = {}
+
+    def _grams(self, entity: BaseModel) -> Set[str]:
+        grams = set()
+        for field in self._fields:
+            grams |= trigrams(getattr(entity, field).lower())
+        return grams
+
+    def _index(self, entity: BaseModel) -> None:
+        for gram in self._grams(entity):
+            self._postings.setdefault(gram, set()).add(entity.id)
+
+    def _unindex(self, id: str) -> None:
+        for gram in self._grams(self._entities[id]):
+            ids = self._postings.get(gram)
+            if ids is not None:
+                ids.discard(id)
+                if not ids:
+                    del self._postings[gram]
+
+    def search(self, query: str) -> List[BaseModel]:
+        query = query.lower()
+        query_grams = trigrams(query)
+        with self._reading():
+            if not query_grams:
+                candidates = self._entities.keys()
+            else:
+                posting_lists = sorted((self._postings.get(gram, set()) for gram in query_grams), key=len)
+                candidates = set(posting_lists[0])
+                for ids in posting_lists[1:]:
+                    if not candidates:
+                        break
+                    candidates &= ids
+            matched = [
+                id for id in candidates
+                if any(query in getattr(self._entities[id], field).lower() for field in self._fields)
+            ]
+            return self._in_order(matched)
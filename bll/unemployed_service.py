@@ -1,43 +1,52 @@
 from typing import List, Dict, Any
-from collections import Counter
 from dal.repository import IRepository
 from bll.generic_service import GenericService
-from bll.models import Unemployed
+from bll.models import Unemployed, parse_skills
+from bll.text_index import TrigramIndex
+from bll.columnar_store import ColumnarStore
+from bll.sketches import SkillSketch
 
 class UnemployedService(GenericService[Unemployed]):
     def __init__(self, repository: IRepository):
         super().__init__(repository, "unemployed", Unemployed)
+        self._name_index = TrigramIndex(self._entity_store, ["name", "surname"])
+        self._qualification_index = TrigramIndex(self._entity_store, ["qualifications"])
+        self._columns = self._add_index(
+            ColumnarStore(lambda: self._repository.get_all(self._collection), ["name", "surname"])
+        )
 
     def find_by_qualification(self, keyword: str) -> List[Unemployed]:
         if not keyword:
             return []
-        keyword = keyword.lower()
-        all_persons = self.get_all()
-        return [p for p in all_persons if keyword in p.qualifications.lower()]
+        return self._qualification_index.search(keyword)
 
     def find_by_keyword(self, keyword: str) -> List[Unemployed]:
         if not keyword:
             return []
-        keyword = keyword.lower()
-        all_persons = self.get_all()
-        return [
-            p for p in all_persons 
-            if keyword in p.name.lower() or keyword in p.surname.lower()
-        ]
+        return self._name_index.search(keyword)
 
     def get_statistics(self) -> Dict[str, Any]:
-        all_unemployed = self.get_all()
-        total = len(all_unemployed)
-        
-        all_skills = []
-        for person in all_unemployed:
-            all_skills.extend([
-                s.strip().lower() for s in person.qualifications.split(',') if s.strip()
-            ])
-            
-        if not all_skills:
-            top_skill = "N/A"
-        else:
-            top_skill = Counter(all_skills).most_common(1)[0][0]
-            
-        return {"total_unemployed": total, "top_qualification": top_skill}
\ No newline at end of file
+        total = self._columns.count()
+        top = self._columns.top_skill()
+        top_skill = top[0] if top else "N/A"
+        return {"total_unemployed": total, "top_qualification": top_skill}
+
+    def sketch_skills(self, epsilon: float = 0.001, delta: float = 0.01, chunk_size: int = 1000) -> SkillSketch:
+        sketch = SkillSketch(epsilon, delta)
+        for chunk in self._repository.iter_chunks(self._collection, chunk_size):
+            for data in chunk:
+                sketch.add(parse_skills(data.get("qualifications") or ""))
+        return sketch
+
+    def get_approximate_statistics(self, top_k: int = 10, epsilon: float = 0.001, delta: float = 0.01) -> Dict[str, Any]:
+        sketch = self.sketch_skills(epsilon, delta)
+        top_skills = sketch.top_k(top_k)
+        return {
+            "total_unemployed": sketch.documents,
+            "top_qualification": top_skills[0][0] if top_skills else "N/A",
+            "top_skills": top_skills,
+            "error_bound": sketch.error_bound(),
+        }
+
+    def recompute_statistics(self) -> bool:
+        return self._columns.recompute()
\ No newline at end of file
@@ -0,0 +1,127 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from dataclasses import asdict, fields
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
+
+from bll.generic_service import GenericService
+from bll.service_container import ServiceContainer
+
+FORMATS = ("csv", "jsonl")
+JOURNAL_THRESHOLD = 64 * 1024 * 1024
+
+class ImportInterrupted(Exception):
+    def __init__(self, committed: int, cause: Exception):
+        super().__init__(f"Імпорт перервано після {committed} збережених записів: {cause}")
+        self.committed = committed
+
+def build_container(data_path: str) -> ServiceContainer:
+    return ServiceContainer.from_json(data_path, journal=True, journal_threshold=JOURNAL_THRESHOLD)
+
+def build_services(data_path: str) -> Dict[str, GenericService]:
+    return services_of(build_container(data_path))
+
+def services_of(container: ServiceContainer) -> Dict[str, GenericService]:
+    return {
+        "unemployed": container.unemployed_service,
+        "companies": container.company_service,
+        "vacancies": container.vacancy_service,
+        "resumes": container.resume_service
+    }
+
+def detect_format(path: str, fmt: str = None) -> str:
+    fmt = fmt or os.path.splitext(path)[1].lstrip(".").lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Невідомий формат '{fmt}', підтримуються: {', '.join(FORMATS)}")
+    return fmt
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def read_records(path: str, fmt: str) -> Iterator[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if fmt == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+def write_records(path: str, fmt: str, records: Iterable[Dict[str, Any]], field_names: List[str]) -> int:
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=field_names) if fmt == "csv" else None
+        if writer:
+            writer.writeheader()
+        for record in records:
+            if writer:
+                writer.writerow(record)
+            else:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+def record_to_entity(model_type, record: Dict[str, Any]):
+    values = {}
+    for f in fields(model_type):
+        value = record.get(f.name)
+        if value is None or value == "":
+            continue
+        values[f.name] = f.type(value) if f.type in (int, float) else value
+    return model_type(**values)
+
+def import_records(service: GenericService, path: str, fmt: str, chunk_size: int = 1000) -> int:
+    total = 0
+    records = read_records(path, fmt)
+    for chunk in chunked(records, chunk_size):
+        try:
+            entities = [record_to_entity(service.model_type, record) for record in chunk]
+            service.add_many(entities)
+        except Exception as e:
+            raise ImportInterrupted(total, e) from e
+        total += len(entities)
+    return total
+
+def export_records(service: GenericService, path: str, fmt: str, chunk_size: int = 1000) -> int:
+    field_names = [f.name for f in fields(service.model_type)]
+    records = (asdict(entity) for chunk in service.iter_chunks(chunk_size) for entity in chunk)
+    return write_records(path, fmt, records, field_names)
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Імпорт та експорт даних біржі праці")
+    parser.add_argument("action", choices=("import", "export"))
+    parser.add_argument("collection", choices=("unemployed", "companies", "vacancies", "resumes"))
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=FORMATS, default=None)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--data", default="dal/data.json")
+    args = parser.parse_args(argv)
+
+    container = build_container(args.data)
+    service = services_of(container)[args.collection]
+    try:
+        fmt = detect_format(args.path, args.format)
+        if args.action == "import":
+            count = import_records(service, args.path, fmt, args.chunk_size)
+            print(f"Імпортовано записів: {count}")
+        else:
+            count = export_records(service, args.path, fmt, args.chunk_size)
+            print(f"Експортовано записів: {count}")
+    except (ImportInterrupted, OSError, ValueError) as e:
+        print(f"Помилка: {e}", file=sys.stderr)
+        return 1
+    finally:
+        container.repository.compact()
+        container.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,19 @@
 import json
 import os
-from typing import List, Dict, Any, Protocol
+import threading
+import weakref
+from typing import List, Dict, Any, Callable, Iterator, Optional, Protocol, Set, Tuple
 from abc import ABC, abstractmethod
+from dal.locking import FileLock, ReadWriteLock, atomic_write_text
+
+ChangeListener = Callable[[Optional[str], str, List[Dict[str, Any]]], None]
 
 class IRepository(Protocol):
     @abstractmethod
     def get_all(self, collection: str) -> List[Dict[str, Any]]: ...
+
+    @abstractmethod
+    def iter_chunks(self, collection: str, chunk_size: int) -> Iterator[List[Dict[str, Any]]]: ...
         
     @abstractmethod
     def get_by_id(self, collection: str, id: str) -> Dict[str, Any]: ...
@@ -19,85 +27,440 @@ class IRepository(Protocol):
     @abstractmethod
     def delete(self, collection: str, id: str) -> None: ...
 
-class JsonRepository(IRepository):
-    def __init__(self, filepath: str = 'dal/data.json'):
+    @abstractmethod
+    def add_many(self, collection: str, entities: List[Dict[str, Any]]) -> None: ...
+
+    @abstractmethod
+    def update_many(self, collection: str, entities: List[Dict[str, Any]]) -> None: ...
+
+    @abstractmethod
+    def delete_many(self, collection: str, ids: List[str]) -> None: ...
+
+    @abstractmethod
+    def get_many(self, collection: str, ids: List[str]) -> Dict[str, Dict[str, Any]]: ...
+
+    @abstractmethod
+    def find_by_field(self, collection: str, field: str, value: Any) -> List[Dict[str, Any]]: ...
+
+    @abstractmethod
+    def subscribe(self, listener: ChangeListener) -> None: ...
+
+    @abstractmethod
+    def refresh(self) -> None: ...
+
+class ChangeNotifier:
+    def __init__(self):
+        self._listeners: List[Any] = []
+        self._listeners_lock = threading.Lock()
+
+    def subscribe(self, listener: ChangeListener) -> None:
+        ref = weakref.WeakMethod(listener) if hasattr(listener, "__self__") else (lambda: listener)
+        with self._listeners_lock:
+            self._listeners.append(ref)
+
+    def _notify(self, collection: Optional[str], action: str, entities: List[Dict[str, Any]]) -> None:
+        with self._listeners_lock:
+            refs = list(self._listeners)
+        dead = set()
+        for ref in refs:
+            listener = ref()
+            if listener is None:
+                dead.add(id(ref))
+                continue
+            listener(collection, action, entities)
+        if dead:
+            with self._listeners_lock:
+                self._listeners = [ref for ref in self._listeners if id(ref) not in dead]
+
+class JsonRepository(ChangeNotifier, IRepository):
+    def __init__(self, filepath: str = 'dal/data.json', use_cache: bool = False,
+                 journal: bool = False, journal_threshold: int = 1_000_000):
         self.filepath = filepath
+        self.use_cache = use_cache
+        self.journal = journal
+        self.journal_path = f"{filepath}.log"
+        self.journal_threshold = journal_threshold
+        super().__init__()
+        self._cache: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._seen_signature: Optional[Tuple[Any, ...]] = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._indexed_data: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._indexes: Dict[str, Dict[str, int]] = {}
+        self._field_indexes: Dict[str, Dict[str, Dict[Any, Set[str]]]] = {}
+        self._lock = FileLock(f"{filepath}.lock")
+        self._rw_lock = ReadWriteLock()
+        self._reload_lock = threading.Lock()
         self._ensure_file_exists()
 
     def _ensure_file_exists(self):
         os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
-        if not os.path.exists(self.filepath):
-            initial_data = {
-                "unemployed": [],
-                "companies": [],
-                "vacancies": [],
-                "resumes": []
-            }
-            self._save_all(initial_data)
+        with self._lock:
+            if not os.path.exists(self.filepath):
+                initial_data = {
+                    "unemployed": [],
+                    "companies": [],
+                    "vacancies": [],
+                    "resumes": []
+                }
+                self._save_all(initial_data)
 
-    def _load_all(self) -> Dict[str, List[Dict[str, Any]]]:
+    def _file_signature(self, path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _current_signature(self) -> Optional[Tuple[Any, ...]]:
+        signature = self._file_signature(self.filepath)
+        if signature is None:
+            return None
+        if self.journal:
+            return (signature, self._file_signature(self.journal_path))
+        return (signature,)
+
+    def _read_file(self) -> Dict[str, List[Dict[str, Any]]]:
         try:
             with open(self.filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (IOError, json.JSONDecodeError):
-            return {"unemployed": [], "companies": [], "vacancies": [], "resumes": []}
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {"unemployed": [], "companies": [], "vacancies": [], "resumes": []}
 
-    def _save_all(self, data: Dict[str, List[Dict[str, Any]]]):
+        if self.journal:
+            self._replay_journal(data)
+        return data
+
+    def _replay_journal(self, data: Dict[str, List[Dict[str, Any]]]):
         try:
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break
+                    try:
+                        op = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    self._apply(data, op, replaying=True)
+        except FileNotFoundError:
+            pass
+
+    def _load_all(self) -> Dict[str, List[Dict[str, Any]]]:
+        if self.journal:
+            with self._lock.shared():
+                return self._load_cached()
+        return self._load_cached()
+
+    def _load_cached(self) -> Dict[str, List[Dict[str, Any]]]:
+        signature = self._current_signature()
+        cache = self._cache
+        if self.use_cache and cache is not None and signature is not None and signature == self._seen_signature:
+            self._cache_hits += 1
+            return cache
+
+        if self.use_cache:
+            with self._reload_lock:
+                signature = self._current_signature()
+                changed = signature is None or signature != self._seen_signature
+                if self._cache is not None and not changed:
+                    self._cache_hits += 1
+                    return self._cache
+                data = self._read_file()
+                self._cache_misses += 1
+                self._cache = data
+                previous = self._seen_signature
+                self._seen_signature = signature
+        else:
+            data = self._read_file()
+            with self._reload_lock:
+                changed = signature is None or signature != self._seen_signature
+                previous = self._seen_signature
+                self._seen_signature = signature
+
+        if changed and previous is not None:
+            self._notify(None, "reset", [])
+        return data
+
+    def _save_all(self, data: Dict[str, List[Dict[str, Any]]]) -> bool:
+        try:
+            atomic_write_text(self.filepath, json.dumps(data, indent=4, ensure_ascii=False))
         except IOError as e:
+            self.invalidate_cache()
             print(f"Помилка збереження файлу: {e}")
+            return False
+
+        if self.use_cache:
+            self._cache = data
+        self._seen_signature = self._current_signature()
+        return True
+
+    def _truncate_torn_tail(self, f):
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - 4096)
+            f.seek(start)
+            newline = f.read(position - start).rfind(b"\n")
+            if newline != -1:
+                if start + newline + 1 < end:
+                    f.truncate(start + newline + 1)
+                return
+            position = start
+        if end:
+            f.truncate(0)
+
+    def _append_journal(self, op: Dict[str, Any]):
+        try:
+            with open(self.journal_path, 'a+b') as f:
+                self._truncate_torn_tail(f)
+                f.write((json.dumps(op, ensure_ascii=False) + "\n").encode('utf-8'))
+                f.flush()
+                os.fsync(f.fileno())
+        except IOError as e:
+            self.invalidate_cache()
+            print(f"Помилка запису журналу: {e}")
+            return
+
+        self._seen_signature = self._current_signature()
+
+    def _persist(self, data: Dict[str, List[Dict[str, Any]]], op: Dict[str, Any]):
+        if not self.journal:
+            self._save_all(data)
+            return
+
+        self._append_journal(op)
+        journal_signature = self._file_signature(self.journal_path)
+        if journal_signature is not None and journal_signature[1] >= self.journal_threshold:
+            self._compact(data)
+
+    def _compact(self, data: Dict[str, List[Dict[str, Any]]]):
+        if not self._save_all(data):
+            return
+        with open(self.journal_path, 'w', encoding='utf-8'):
+            pass
+        self._seen_signature = self._current_signature()
+
+    def compact(self) -> None:
+        if self.journal:
+            with self._rw_lock.write(), self._lock:
+                self._compact(self._load_all())
+
+    def invalidate_cache(self) -> None:
+        with self._rw_lock.write():
+            self._cache = None
+            self._seen_signature = None
+        self._notify(None, "reset", [])
+
+    def refresh(self) -> None:
+        with self._rw_lock.read():
+            self._load_all()
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        return {"hits": self._cache_hits, "misses": self._cache_misses}
+
+    def _check_indexed_data(self, data: Dict[str, List[Dict[str, Any]]]):
+        if self._indexed_data is not data:
+            self._indexed_data = data
+            self._indexes = {}
+            self._field_indexes = {}
+
+    def _get_index(self, data: Dict[str, List[Dict[str, Any]]], collection: str) -> Dict[str, int]:
+        self._check_indexed_data(data)
+        index = self._indexes.get(collection)
+        if index is None:
+            index = {}
+            for i, item in enumerate(data.get(collection, [])):
+                index.setdefault(item.get('id'), i)
+            self._indexes[collection] = index
+        return index
+
+    def _get_field_index(self, data: Dict[str, List[Dict[str, Any]]], collection: str, field: str) -> Dict[Any, Set[str]]:
+        self._check_indexed_data(data)
+        field_indexes = self._field_indexes.setdefault(collection, {})
+        index = field_indexes.get(field)
+        if index is None:
+            index = {}
+            for item in data.get(collection, []):
+                index.setdefault(item.get(field), set()).add(item.get('id'))
+            field_indexes[field] = index
+        return index
+
+    def _index_fields(self, collection: str, entity: Dict[str, Any], add: bool):
+        for field, index in self._field_indexes.get(collection, {}).items():
+            value = entity.get(field)
+            if add:
+                index.setdefault(value, set()).add(entity.get('id'))
+            elif value in index:
+                index[value].discard(entity.get('id'))
+                if not index[value]:
+                    del index[value]
+
+    def _replace(self, collection: str, items: List[Dict[str, Any]], position: int, entity: Dict[str, Any]):
+        self._index_fields(collection, items[position], add=False)
+        items[position] = entity
+        self._index_fields(collection, entity, add=True)
+
+    def _apply(self, data: Dict[str, List[Dict[str, Any]]], op: Dict[str, Any], replaying: bool = False):
+        collection = op["collection"]
+        items = data.setdefault(collection, [])
+        index = self._get_index(data, collection)
+
+        if op["op"] == "add":
+            entity = op["entity"]
+            position = index.get(entity.get('id'))
+            if position is not None and replaying:
+                self._replace(collection, items, position, entity)
+            else:
+                items.append(entity)
+                index.setdefault(entity.get('id'), len(items) - 1)
+                self._index_fields(collection, entity, add=True)
+        elif op["op"] == "update":
+            entity = op["entity"]
+            position = index.get(entity.get('id'))
+            if position is not None:
+                self._replace(collection, items, position, entity)
+        elif op["op"] == "delete":
+            position = index.pop(op["id"], None)
+            if position is not None:
+                self._index_fields(collection, items.pop(position), add=False)
+                for i in range(position, len(items)):
+                    item_id = items[i].get('id')
+                    if index.get(item_id, i + 1) == i + 1:
+                        index[item_id] = i
+        elif op["op"] == "add_many":
+            for entity in op["entities"]:
+                self._apply(data, {"op": "add", "collection": collection, "entity": entity}, replaying)
+        elif op["op"] == "update_many":
+            for entity in op["entities"]:
+                position = index.get(entity.get('id'))
+                if position is not None:
+                    self._replace(collection, items, position, entity)
+        elif op["op"] == "delete_many":
+            ids = set(op["ids"])
+            items[:] = [item for item in items if item.get('id') not in ids]
+            self._indexes.pop(collection, None)
+            self._field_indexes.pop(collection, None)
 
     def get_all(self, collection: str) -> List[Dict[str, Any]]:
-        data = self._load_all()
-        return data.get(collection, [])
+        with self._rw_lock.read():
+            data = self._load_all()
+            return list(data.get(collection, []))
+
+    def iter_chunks(self, collection: str, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        items = self.get_all(collection)
+        for start in range(0, len(items), chunk_size):
+            yield items[start:start + chunk_size]
 
     def get_by_id(self, collection: str, id: str) -> Dict[str, Any]:
-        all_items = self.get_all(collection)
-        for item in all_items:
-            if item.get('id') == id:
-                return item
-        raise FileNotFoundError(f"Об'єкт з ID {id} не знайдено в {collection}")
+        with self._rw_lock.read():
+            data = self._load_all()
+            position = self._get_index(data, collection).get(id)
+            if position is None:
+                raise FileNotFoundError(f"Об'єкт з ID {id} не знайдено в {collection}")
+            return data[collection][position]
+
+    def get_many(self, collection: str, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        with self._rw_lock.read():
+            data = self._load_all()
+            index = self._get_index(data, collection)
+            return {id: data[collection][index[id]] for id in ids if id in index}
+
+    def _check_new_ids(self, data: Dict[str, List[Dict[str, Any]]], collection: str, ids: List[str]):
+        index = self._get_index(data, collection)
+        seen = set()
+        for id in ids:
+            if id in index or id in seen:
+                raise FileExistsError(f"Об'єкт з ID {id} вже існує в {collection}")
+            seen.add(id)
 
     def add(self, collection: str, entity: Dict[str, Any]) -> None:
-        data = self._load_all()
-        if collection not in data:
-            data[collection] = []
-        data[collection].append(entity)
-        self._save_all(data)
+        with self._rw_lock.write(), self._lock:
+            data = self._load_all()
+            self._check_new_ids(data, collection, [entity.get('id')])
+            op = {"op": "add", "collection": collection, "entity": entity}
+            self._apply(data, op)
+            self._persist(data, op)
+            self._notify(collection, "add", [entity])
 
     def update(self, collection: str, entity: Dict[str, Any]) -> None:
-        data = self._load_all()
-        item_id = entity.get('id')
-        if collection not in data:
-            raise KeyError(f"Колекція {collection} не існує")
-            
-        index_to_update = -1
-        for i, item in enumerate(data[collection]):
-            if item.get('id') == item_id:
-                index_to_update = i
-                break
-                
-        if index_to_update == -1:
-            raise FileNotFoundError(f"Об'єкт з ID {item_id} не знайдено для оновлення")
-            
-        data[collection][index_to_update] = entity
-        self._save_all(data)
+        with self._rw_lock.write(), self._lock:
+            data = self._load_all()
+            item_id = entity.get('id')
+            if collection not in data:
+                raise KeyError(f"Колекція {collection} не існує")
+
+            if item_id not in self._get_index(data, collection):
+                raise FileNotFoundError(f"Об'єкт з ID {item_id} не знайдено для оновлення")
+
+            op = {"op": "update", "collection": collection, "entity": entity}
+            self._apply(data, op)
+            self._persist(data, op)
+            self._notify(collection, "update", [entity])
 
     def delete(self, collection: str, id: str) -> None:
-        data = self._load_all()
-        if collection not in data:
-            raise KeyError(f"Колекція {collection} не існує")
-
-        index_to_delete = -1
-        for i, item in enumerate(data[collection]):
-            if item.get('id') == id:
-                index_to_delete = i
-                break
-                
-        if index_to_delete == -1:
-            raise FileNotFoundError(f"Об'єкт з ID {id} не знайдено для видалення")
-            
-        data[collection].pop(index_to_delete)
-        self._save_all(data)
\ No newline at end of file
+        with self._rw_lock.write(), self._lock:
+            data = self._load_all()
+            if collection not in data:
+                raise KeyError(f"Колекція {collection} не існує")
+
+            position = self._get_index(data, collection).get(id)
+            if position is None:
+                raise FileNotFoundError(f"Об'єкт з ID {id} не знайдено для видалення")
+
+            removed = data[collection][position]
+            op = {"op": "delete", "collection": collection, "id": id}
+            self._apply(data, op)
+            self._persist(data, op)
+            self._notify(collection, "delete", [removed])
+
+    def add_many(self, collection: str, entities: List[Dict[str, Any]]) -> None:
+        with self._rw_lock.write(), self._lock:
+            data = self._load_all()
+            entities = list(entities)
+            self._check_new_ids(data, collection, [entity.get('id') for entity in entities])
+            op = {"op": "add_many", "collection": collection, "entities": entities}
+            self._apply(data, op)
+            self._persist(data, op)
+            self._notify(collection, "add", op["entities"])
+
+    def update_many(self, collection: str, entities: List[Dict[str, Any]]) -> None:
+        with self._rw_lock.write(), self._lock:
+            data = self._load_all()
+            if collection not in data:
+                raise KeyError(f"Колекція {collection} не існує")
+
+            index = self._get_index(data, collection)
+            for entity in entities:
+                if entity.get('id') not in index:
+                    raise FileNotFoundError(f"Об'єкт з ID {entity.get('id')} не знайдено для оновлення")
+
+            op = {"op": "update_many", "collection": collection, "entities": list(entities)}
+            self._apply(data, op)
+            self._persist(data, op)
+            self._notify(collection, "update", op["entities"])
+
+    def delete_many(self, collection: str, ids: List[str]) -> None:
+        with self._rw_lock.write(), self._lock:
+            data = self._load_all()
+            if collection not in data:
+                raise KeyError(f"Колекція {collection} не існує")
+
+            index = self._get_index(data, collection)
+            for id in ids:
+                if id not in index:
+                    raise FileNotFoundError(f"Об'єкт з ID {id} не знайдено для видалення")
+
+            removed = [data[collection][index[id]] for id in dict.fromkeys(ids)]
+            op = {"op": "delete_many", "collection": collection, "ids": list(ids)}
+            self._apply(data, op)
+            self._persist(data, op)
+            self._notify(collection, "delete", removed)
+
+    def find_by_field(self, collection: str, field: str, value: Any) -> List[Dict[str, Any]]:
+        with self._rw_lock.read():
+            data = self._load_all()
+            ids = self._get_field_index(data, collection, field).get(value, ())
+            index = self._get_index(data, collection)
+            positions = sorted(index[id] for id in ids if id in index)
+            return [data[collection][position] for position in positions]
+    
\ No newline at end of file
@@ -0,0 +1,228 @@
+import json
+import os
+import sqlite3
+import sys
+import threading
+from typing import Any, Dict, Iterator, List
+from dal.repository import ChangeNotifier, IRepository
+
+SQLITE_MAX_PARAMS = 900
+
+COLLECTION_COLUMNS = {
+    "unemployed": [],
+    "companies": [],
+    "vacancies": ["company_id"],
+    "resumes": ["unemployed_id"]
+}
+
+class SqliteRepository(ChangeNotifier, IRepository):
+    def __init__(self, filepath: str = 'dal/data.db'):
+        self.filepath = filepath
+        super().__init__()
+        self._local = threading.local()
+        self._generation_lock = threading.Lock()
+        self._ensure_schema()
+        self._seen_generation = self._read_generation()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.filepath, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _ensure_schema(self):
+        directory = os.path.dirname(self.filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        with conn:
+            for collection, columns in COLLECTION_COLUMNS.items():
+                extra = "".join(f", {column} TEXT" for column in columns)
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {collection} ("
+                    f"position INTEGER PRIMARY KEY AUTOINCREMENT, "
+                    f"id TEXT NOT NULL{extra}, data TEXT NOT NULL)"
+                )
+                conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS idx_{collection}_id ON {collection}(id)")
+                for column in columns:
+                    conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{collection}_{column} ON {collection}({column})")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', 0)")
+
+    def _read_generation(self) -> int:
+        return self._connect().execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()[0]
+
+    def _bump_generation(self, conn: sqlite3.Connection) -> int:
+        conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'generation'")
+        return conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()[0]
+
+    def _mark_seen(self, generation: int):
+        with self._generation_lock:
+            if self._seen_generation == generation - 1:
+                self._seen_generation = generation
+
+    def refresh(self) -> None:
+        generation = self._read_generation()
+        with self._generation_lock:
+            changed = generation != self._seen_generation
+            self._seen_generation = generation
+        if changed:
+            self._notify(None, "reset", [])
+
+    def _check_collection(self, collection: str):
+        if collection not in COLLECTION_COLUMNS:
+            raise KeyError(f"Колекція {collection} не існує")
+
+    def _row_values(self, collection: str, entity: Dict[str, Any]) -> List[Any]:
+        columns = COLLECTION_COLUMNS[collection]
+        return [entity.get('id')] + [entity.get(column) for column in columns] + [json.dumps(entity, ensure_ascii=False)]
+
+    def get_all(self, collection: str) -> List[Dict[str, Any]]:
+        if collection not in COLLECTION_COLUMNS:
+            return []
+        rows = self._connect().execute(f"SELECT data FROM {collection} ORDER BY position")
+        return [json.loads(row[0]) for row in rows]
+
+    def iter_chunks(self, collection: str, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        if collection not in COLLECTION_COLUMNS:
+            return
+        cursor = self._connect().execute(f"SELECT data FROM {collection} ORDER BY position")
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield [json.loads(row[0]) for row in rows]
+
+    def get_by_id(self, collection: str, id: str) -> Dict[str, Any]:
+        row = None
+        if collection in COLLECTION_COLUMNS:
+            row = self._connect().execute(f"SELECT data FROM {collection} WHERE id = ?", (id,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"Об'єкт з ID {id} не знайдено в {collection}")
+        return json.loads(row[0])
+
+    def get_many(self, collection: str, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        if collection not in COLLECTION_COLUMNS:
+            return {}
+        ids = list(dict.fromkeys(ids))
+        result = {}
+        conn = self._connect()
+        for start in range(0, len(ids), SQLITE_MAX_PARAMS):
+            chunk = ids[start:start + SQLITE_MAX_PARAMS]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = conn.execute(f"SELECT id, data FROM {collection} WHERE id IN ({placeholders})", chunk)
+            for id, data in rows:
+                result[id] = json.loads(data)
+        return result
+
+    def find_by_field(self, collection: str, field: str, value: Any) -> List[Dict[str, Any]]:
+        if collection not in COLLECTION_COLUMNS:
+            return []
+        if field == "id" or field in COLLECTION_COLUMNS[collection]:
+            rows = self._connect().execute(
+                f"SELECT data FROM {collection} WHERE {field} = ? ORDER BY position", (value,)
+            )
+        else:
+            rows = self._connect().execute(
+                f"SELECT data FROM {collection} WHERE json_extract(data, ?) = ? ORDER BY position",
+                (f"$.{field}", value)
+            )
+        return [json.loads(row[0]) for row in rows]
+
+    def add(self, collection: str, entity: Dict[str, Any]) -> None:
+        self.add_many(collection, [entity])
+
+    def update(self, collection: str, entity: Dict[str, Any]) -> None:
+        self.update_many(collection, [entity])
+
+    def delete(self, collection: str, id: str) -> None:
+        self.delete_many(collection, [id])
+
+    def _check_new_ids(self, conn: sqlite3.Connection, collection: str, ids: List[str]):
+        seen = set()
+        for id in ids:
+            if id in seen:
+                raise FileExistsError(f"Об'єкт з ID {id} вже існує в {collection}")
+            seen.add(id)
+        for start in range(0, len(ids), SQLITE_MAX_PARAMS):
+            chunk = ids[start:start + SQLITE_MAX_PARAMS]
+            placeholders = ", ".join("?" for _ in chunk)
+            row = conn.execute(f"SELECT id FROM {collection} WHERE id IN ({placeholders}) LIMIT 1", chunk).fetchone()
+            if row is not None:
+                raise FileExistsError(f"Об'єкт з ID {row[0]} вже існує в {collection}")
+
+    def add_many(self, collection: str, entities: List[Dict[str, Any]]) -> None:
+        self._check_collection(collection)
+        columns = ["id"] + COLLECTION_COLUMNS[collection] + ["data"]
+        placeholders = ", ".join("?" for _ in columns)
+        conn = self._connect()
+        with conn:
+            generation = self._bump_generation(conn)
+            self._check_new_ids(conn, collection, [entity.get('id') for entity in entities])
+            conn.executemany(
+                f"INSERT INTO {collection} ({', '.join(columns)}) VALUES ({placeholders})",
+                (self._row_values(collection, entity) for entity in entities)
+            )
+        self._mark_seen(generation)
+        self._notify(collection, "add", list(entities))
+
+    def update_many(self, collection: str, entities: List[Dict[str, Any]]) -> None:
+        self._check_collection(collection)
+        columns = COLLECTION_COLUMNS[collection] + ["data"]
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        conn = self._connect()
+        with conn:
+            generation = self._bump_generation(conn)
+            for entity in entities:
+                item_id = entity.get('id')
+                values = self._row_values(collection, entity)[1:] + [item_id]
+                cursor = conn.execute(f"UPDATE {collection} SET {assignments} WHERE id = ?", values)
+                if cursor.rowcount == 0:
+                    raise FileNotFoundError(f"Об'єкт з ID {item_id} не знайдено для оновлення")
+        self._mark_seen(generation)
+        self._notify(collection, "update", list(entities))
+
+    def delete_many(self, collection: str, ids: List[str]) -> None:
+        self._check_collection(collection)
+        conn = self._connect()
+        removed = []
+        with conn:
+            generation = self._bump_generation(conn)
+            for id in dict.fromkeys(ids):
+                row = conn.execute(f"SELECT data FROM {collection} WHERE id = ?", (id,)).fetchone()
+                if row is None:
+                    raise FileNotFoundError(f"Об'єкт з ID {id} не знайдено для видалення")
+                conn.execute(f"DELETE FROM {collection} WHERE id = ?", (id,))
+                removed.append(json.loads(row[0]))
+        self._mark_seen(generation)
+        self._notify(collection, "delete", removed)
+
+def migrate_json_to_sqlite(json_path: str, sqlite_path: str) -> Dict[str, Dict[str, int]]:
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    repo = SqliteRepository(filepath=sqlite_path)
+    conn = repo._connect()
+    counts = {}
+    with conn:
+        repo._bump_generation(conn)
+        for collection, columns in COLLECTION_COLUMNS.items():
+            entities = data.get(collection, [])
+            all_columns = ["id"] + columns + ["data"]
+            placeholders = ", ".join("?" for _ in all_columns)
+            cursor = conn.executemany(
+                f"INSERT OR IGNORE INTO {collection} ({', '.join(all_columns)}) VALUES ({placeholders})",
+                (repo._row_values(collection, entity) for entity in entities)
+            )
+            counts[collection] = {"migrated": cursor.rowcount, "duplicates": len(entities) - cursor.rowcount}
+    return counts
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Використання: python -m dal.sqlite_repository <data.json> <data.db>")
+        sys.exit(1)
+    for name, count in migrate_json_to_sqlite(sys.argv[1], sys.argv[2]).items():
+        print(f"{name}: {count['migrated']} (пропущено дублікатів ID: {count['duplicates']})")
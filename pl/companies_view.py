@@ -1,7 +1,7 @@
 import streamlit as st
 from bll.exceptions import ValidationException, EntityNotFoundException
 from bll.models import Company
-from pl.utils import get_selection_options
+from pl.utils import get_selection_options, PAGE_SIZE
 
 def show_companies_page(company_service, vacancy_service):
     st.header("🏢 Управління фірмами-замовниками")
@@ -10,9 +10,9 @@ def show_companies_page(company_service, vacancy_service):
 
     with tabs[0]:
         st.subheader("Список фірм")
+        page = st.number_input("Сторінка:", min_value=1, step=1, key="companies_page")
         try:
-            companies = company_service.get_all()
-            companies.sort(key=lambda x: x.name)
+            companies = list(company_service.query(sort_by="name", limit=PAGE_SIZE, offset=(page - 1) * PAGE_SIZE))
             if companies:
                 st.dataframe(companies, use_container_width=True, hide_index=True)
             else:
@@ -0,0 +1,27 @@
+import threading
+from typing import Dict
+from bll.service_container import ServiceContainer
+
+try:
+    import streamlit as st
+except ImportError:
+    st = None
+
+_lock = threading.Lock()
+_containers: Dict[str, ServiceContainer] = {}
+
+def _shared_container(filepath: str) -> ServiceContainer:
+    with _lock:
+        container = _containers.get(filepath)
+        if container is None:
+            container = ServiceContainer.from_json(filepath)
+            _containers[filepath] = container
+        return container
+
+if st is not None:
+    _shared_container = st.cache_resource(show_spinner=False)(_shared_container)
+
+def get_container(filepath: str = 'dal/data.json') -> ServiceContainer:
+    container = _shared_container(filepath)
+    container.refresh()
+    return container
@@ -1,6 +1,8 @@
 import streamlit as st
 from pl.utils import get_selection_options
 
+PAGE_SIZE = 20
+
 def show_matching_page(resume_service, vacancy_service, company_service, unemployed_service):
     st.header("🤖 Підбір вакансій та резюме")
 
@@ -21,22 +23,24 @@ def show_matching_page(resume_service, vacancy_service, company_service, unemplo
                 
                 st.write(f"**Кваліфікації в резюме:** {resume.qualifications or 'N/A'}")
                 
-                matches = vacancy_service.find_matches_for_resume(resume)
+                page = st.number_input("Сторінка:", min_value=1, step=1, key="match_resume_page")
+                offset = (page - 1) * PAGE_SIZE
+                matches = vacancy_service.find_matches_for_resume(resume, limit=PAGE_SIZE, offset=offset)
                 
                 if matches:
-                    st.write(f"Знайдено {len(matches)} вакансій:")
+                    st.write(f"Вакансії {offset + 1}–{offset + len(matches)}:")
+                    companies = company_service.get_many({match['vacancy'].company_id for match in matches})
                     for match in matches:
                         score_percent = f"{match['score']*100:.0f}%"
                         
-                        try:
-                            company = company_service.get_by_id(match['vacancy'].company_id)
-                            company_name = company.name
-                        except Exception:
-                            company_name = "Компанію не знайдено"
+                        company = companies.get(match['vacancy'].company_id)
+                        company_name = company.name if company else "Компанію не знайдено"
 
                         st.info(f"**{match['vacancy'].title}** | {company_name} ({score_percent} збіг)")
                         st.write(f"**Вимоги:** {match['vacancy'].qualifications}")
                         st.divider()
+                elif page > 1:
+                    st.info("На цій сторінці вакансій немає.")
                 else:
                     st.info("Відповідних вакансій не знайдено.")
                     
@@ -58,23 +62,24 @@ def show_matching_page(resume_service, vacancy_service, company_service, unemplo
                 
                 st.write(f"**Вимоги вакансії:** {vacancy.qualifications or 'N/A'}")
                 
-                all_resumes = resume_service.get_all()
-                matches = vacancy_service.find_matches_for_vacancy(vacancy, all_resumes)
+                page = st.number_input("Сторінка:", min_value=1, step=1, key="match_vacancy_page")
+                offset = (page - 1) * PAGE_SIZE
+                matches = vacancy_service.find_matches_for_vacancy(vacancy, limit=PAGE_SIZE, offset=offset)
                 
                 if matches:
-                    st.write(f"Знайдено {len(matches)} резюме:")
+                    st.write(f"Резюме {offset + 1}–{offset + len(matches)}:")
+                    persons = unemployed_service.get_many({match['resume'].unemployed_id for match in matches})
                     for match in matches:
                         score_percent = f"{match['score']*100:.0f}%"
                         
-                        try:
-                            person = unemployed_service.get_by_id(match['resume'].unemployed_id)
-                            person_name = f"{person.surname} {person.name}"
-                        except Exception:
-                            person_name = "Автора не знайдено"
+                        person = persons.get(match['resume'].unemployed_id)
+                        person_name = f"{person.surname} {person.name}" if person else "Автора не знайдено"
 
                         st.info(f"**{match['resume'].title}** | {person_name} ({score_percent} збіг)")
                         st.write(f"**Кваліфікації:** {match['resume'].qualifications}")
                         st.divider()
+                elif page > 1:
+                    st.info("На цій сторінці резюме немає.")
                 else:
                     st.info("Відповідних резюме не знайдено.")
                     
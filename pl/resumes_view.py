@@ -1,7 +1,7 @@
 import streamlit as st
 from bll.exceptions import ValidationException, EntityNotFoundException
 from bll.models import Resume
-from pl.utils import get_selection_options
+from pl.utils import get_selection_options, PAGE_SIZE
 
 def show_resumes_page(resume_service, unemployed_service):
     st.header("📑 Управління резюме")
@@ -10,9 +10,9 @@ def show_resumes_page(resume_service, unemployed_service):
 
     with tabs[0]:
         st.subheader("Список резюме")
+        page = st.number_input("Сторінка:", min_value=1, step=1, key="resumes_page")
         try:
-            resumes = resume_service.get_all()
-            resumes.sort(key=lambda x: x.title)
+            resumes = list(resume_service.query(sort_by="title", limit=PAGE_SIZE, offset=(page - 1) * PAGE_SIZE))
             if resumes:
                 st.dataframe(resumes, use_container_width=True, hide_index=True)
             else:
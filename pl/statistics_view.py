@@ -1,6 +1,6 @@
 import streamlit as st
 
-def show_statistics_page(unemployed_service):
+def show_statistics_page(unemployed_service, analytics_service):
     st.header("📊 Статистика")
 
     try:
@@ -11,4 +11,39 @@ def show_statistics_page(unemployed_service):
         col2.metric("Найпопулярніша кваліфікація", stats["top_qualification"])
         
     except Exception as e:
-        st.error(f"Помилка при розрахунку статистики: {e}")
\ No newline at end of file
+        st.error(f"Помилка при розрахунку статистики: {e}")
+
+    st.subheader("Попит і пропозиція навичок")
+    top_n = st.number_input("Кількість навичок у рейтингу:", min_value=1, max_value=50, value=10, step=1)
+
+    try:
+        report = analytics_service.get_skill_report(top_n=int(top_n))
+
+        col1, col2 = st.columns(2)
+        col1.caption("Пропозиція (безробітні)")
+        col1.dataframe(
+            [{"Навичка": skill, "Кількість": count} for skill, count in report["top_supply"]],
+            use_container_width=True, hide_index=True
+        )
+        col2.caption("Попит (вакансії)")
+        col2.dataframe(
+            [{"Навичка": skill, "Кількість": count} for skill, count in report["top_demand"]],
+            use_container_width=True, hide_index=True
+        )
+
+        st.caption("Дефіцит навичок (попит перевищує пропозицію)")
+        if report["gap"]:
+            st.dataframe(
+                [{"Навичка": g["skill"], "Попит": g["demand"], "Пропозиція": g["supply"], "Дефіцит": g["gap"]} for g in report["gap"]],
+                use_container_width=True, hide_index=True
+            )
+        else:
+            st.info("Дефіциту навичок не виявлено.")
+
+        st.caption("Розподіл найкращого збігу резюме з вакансіями")
+        st.bar_chart({
+            f"{b['from']:.0%}–{b['to']:.0%}": b["count"] for b in report["score_histogram"]
+        })
+
+    except Exception as e:
+        st.error(f"Помилка при розрахунку аналітики: {e}")
@@ -1,7 +1,7 @@
 import streamlit as st
 from bll.exceptions import ValidationException, EntityNotFoundException
 from bll.models import Unemployed
-from pl.utils import get_selection_options
+from pl.utils import get_selection_options, PAGE_SIZE
 
 def show_unemployed_page(unemployed_service, resume_service):
     st.header("👤 Управління безробітними")
@@ -25,14 +25,13 @@ def show_unemployed_page(unemployed_service, resume_service):
                 format_func=lambda x: x[0],
                 key="unemployed_sort"
             )
+            page = st.number_input("Сторінка:", min_value=1, step=1, key="unemployed_page")
             try:
-                unemployed_list = unemployed_service.get_all()
-                if sort_key[1] == "surname":
-                    unemployed_list.sort(key=lambda x: x.surname)
-                else:
-                    unemployed_list.sort(key=lambda x: x.name)
+                unemployed_list = list(unemployed_service.query(
+                    sort_by=sort_key[1], limit=PAGE_SIZE, offset=(page - 1) * PAGE_SIZE
+                ))
                 
-                st.info(f"Знайдено: {len(unemployed_list)} осіб(а).")
+                st.info(f"Знайдено: {unemployed_service.count()} осіб(а).")
             except Exception as e:
                 st.error(f"Помилка завантаження даних: {e}")
                 unemployed_list = []
@@ -1,3 +1,5 @@
+PAGE_SIZE = 50
+
 def get_selection_options(entity_list, name_attr='name', surname_attr='surname'):
     options = {}
     for item in entity_list:
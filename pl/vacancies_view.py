@@ -1,7 +1,7 @@
 import streamlit as st
 from bll.exceptions import ValidationException, EntityNotFoundException
 from bll.models import Vacancy
-from pl.utils import get_selection_options
+from pl.utils import get_selection_options, PAGE_SIZE
 
 def show_vacancies_page(vacancy_service, company_service):
     st.header("📄 Управління вакансіями")
@@ -11,9 +11,9 @@ def show_vacancies_page(vacancy_service, company_service):
     with tabs[0]:
         st.subheader("Список вакансій")
         
+        page = st.number_input("Сторінка:", min_value=1, step=1, key="vacancies_page")
         try:
-            vacancies = vacancy_service.get_all()
-            vacancies.sort(key=lambda x: x.title)
+            vacancies = list(vacancy_service.query(sort_by="title", limit=PAGE_SIZE, offset=(page - 1) * PAGE_SIZE))
             if vacancies:
                 st.dataframe(vacancies, use_container_width=True, hide_index=True)
             else:
@@ -23,9 +23,13 @@ def show_vacancies_page(vacancy_service, company_service):
         
         st.subheader("Пошук вакансій")
         keyword_vac = st.text_input("Введіть ключове слово (назва, опис, кваліфікації):")
+        ranked = st.checkbox("Сортувати за релевантністю", key="vac_ranked_search")
         if keyword_vac:
             try:
-                results_vac = vacancy_service.find_by_keyword(keyword_vac)
+                if ranked:
+                    results_vac = [match["vacancy"] for match in vacancy_service.search_ranked(keyword_vac, limit=50)]
+                else:
+                    results_vac = vacancy_service.find_by_keyword(keyword_vac)
                 st.dataframe(results_vac, use_container_width=True, hide_index=True)
             except Exception as e:
                 st.error(f"Помилка пошуку: {e}")
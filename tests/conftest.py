@@ -5,6 +5,7 @@ from bll.unemployed_service import UnemployedService
 from bll.company_service import CompanyService
 from bll.vacancy_service import VacancyService
 from bll.resume_service import ResumeService
+from bll.analytics_service import AnalyticsService
 
 @pytest.fixture
 def mock_repo():
@@ -24,4 +25,8 @@ def vacancy_service(mock_repo):
 
 @pytest.fixture
 def resume_service(mock_repo, unemployed_service):
-    return ResumeService(mock_repo, unemployed_service)
\ No newline at end of file
+    return ResumeService(mock_repo, unemployed_service)
+
+@pytest.fixture
+def analytics_service(mock_repo, vacancy_service):
+    return AnalyticsService(mock_repo, vacancy_service)
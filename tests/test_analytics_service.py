@@ -0,0 +1,41 @@
+import pytest
+
+# --- AnalyticsService Tests ---
+
+def test_analytics_skill_report(analytics_service, mock_repo):
+    # Arrange
+    data = {
+        "unemployed": [
+            {"id": "u1", "qualifications": "Python, SQL"},
+            {"id": "u2", "qualifications": "python"},
+        ],
+        "vacancies": [
+            {"id": "v1", "qualifications": "Python, Docker", "company_id": "c1"},
+            {"id": "v2", "qualifications": "Docker, SQL", "company_id": "c1"},
+            {"id": "v3", "qualifications": "Docker", "company_id": "c2"},
+        ],
+        "resumes": [
+            {"id": "r1", "qualifications": "Python, SQL"},
+            {"id": "r2", "qualifications": "Go"},
+            {"id": "r3", "qualifications": "Docker"},
+        ],
+    }
+    mock_repo.get_all.side_effect = lambda collection: data[collection]
+    mock_repo.iter_chunks.side_effect = lambda collection, size: iter([data[collection][:2], data[collection][2:]])
+
+    # Act
+    report = analytics_service.get_skill_report(top_n=2, bins=4)
+
+    # Assert
+    assert report["top_supply"] == [("python", 2), ("sql", 1)]
+    assert report["top_demand"][0] == ("docker", 3)
+    assert report["top_demand"][1] in [("python", 1), ("sql", 1)]
+    assert report["gap"] == [{"skill": "docker", "demand": 3, "supply": 0, "gap": 3}]
+    assert [b["count"] for b in report["score_histogram"]] == [1, 0, 1, 1]
+    assert report["score_histogram"][-1] == {"from": 0.75, "to": 1.0, "count": 1}
+    assert [call.args[0] for call in mock_repo.get_all.call_args_list] == ["vacancies"]
+
+def test_analytics_rejects_non_positive_sizes(analytics_service):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        analytics_service.get_skill_report(top_n=0)
@@ -0,0 +1,111 @@
+import json
+import pytest
+from bll.unemployed_service import UnemployedService
+from cli import build_services, import_records, export_records, detect_format, chunked, main
+from dal.repository import JsonRepository
+
+# --- CLI Import/Export Tests ---
+
+@pytest.fixture
+def services(tmp_path):
+    return build_services(str(tmp_path / "data.json"))
+
+def test_chunked_splits_into_fixed_size_lists():
+    # Act
+    chunks = list(chunked(range(7), 3))
+
+    # Assert
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
+
+def test_detect_format():
+    # Assert
+    assert detect_format("people.csv") == "csv"
+    assert detect_format("people.txt", "jsonl") == "jsonl"
+    with pytest.raises(ValueError):
+        detect_format("people.txt")
+
+def test_import_csv_then_export_jsonl(services, tmp_path):
+    # Arrange
+    csv_path = tmp_path / "people.csv"
+    csv_path.write_text(
+        "id,name,surname,qualifications\n"
+        "1,Іван,Петренко,\"Python, SQL\"\n"
+        ",Марія,Коваль,Java\n",
+        encoding="utf-8"
+    )
+    out_path = tmp_path / "people.jsonl"
+
+    # Act
+    imported = import_records(services["unemployed"], str(csv_path), "csv", chunk_size=1)
+    exported = export_records(services["unemployed"], str(out_path), "jsonl")
+
+    # Assert
+    records = [json.loads(line) for line in out_path.read_text(encoding="utf-8").splitlines()]
+    assert imported == exported == 2
+    assert records[0] == {"id": "1", "version": 0, "name": "Іван", "surname": "Петренко", "qualifications": "Python, SQL"}
+    assert records[1]["id"]
+
+def test_import_resumes_copies_qualifications(services, tmp_path):
+    # Arrange
+    people_path = tmp_path / "people.jsonl"
+    people_path.write_text(json.dumps({"id": "p1", "name": "Анна", "qualifications": "Agile"}) + "\n", encoding="utf-8")
+    resumes_path = tmp_path / "resumes.jsonl"
+    resumes_path.write_text(json.dumps({"title": "PM", "unemployed_id": "p1"}) + "\n", encoding="utf-8")
+
+    # Act
+    import_records(services["unemployed"], str(people_path), "jsonl")
+    import_records(services["resumes"], str(resumes_path), "jsonl")
+
+    # Assert
+    assert services["resumes"].get_all()[0].qualifications == "Agile"
+
+def test_export_streams_repository_chunks(mock_repo, tmp_path):
+    # Arrange
+    mock_repo.iter_chunks.return_value = iter([
+        [{"id": "1", "name": "Іван"}, {"id": "2", "name": "Марія"}],
+        [{"id": "3", "name": "Олег"}]
+    ])
+    service = UnemployedService(mock_repo)
+    out_path = tmp_path / "people.jsonl"
+
+    # Act
+    exported = export_records(service, str(out_path), "jsonl", chunk_size=2)
+
+    # Assert
+    records = [json.loads(line) for line in out_path.read_text(encoding="utf-8").splitlines()]
+    assert exported == 3
+    assert [record["id"] for record in records] == ["1", "2", "3"]
+    mock_repo.iter_chunks.assert_called_once_with("unemployed", 2)
+    mock_repo.get_all.assert_not_called()
+
+def test_main_import_writes_data_file_once(tmp_path, monkeypatch):
+    # Arrange
+    data_path = str(tmp_path / "data.json")
+    JsonRepository(filepath=data_path)
+    people_path = tmp_path / "people.jsonl"
+    people_path.write_text("".join(json.dumps({"id": str(i), "name": f"N{i}"}) + "\n" for i in range(10)), encoding="utf-8")
+    saves = []
+    original_save_all = JsonRepository._save_all
+    monkeypatch.setattr(JsonRepository, "_save_all", lambda self, data: saves.append(1) or original_save_all(self, data))
+
+    # Act
+    code = main(["import", "unemployed", str(people_path), "--chunk-size", "2", "--data", data_path])
+
+    # Assert
+    assert code == 0
+    assert len(saves) == 1
+    assert len(JsonRepository(filepath=data_path).get_all("unemployed")) == 10
+
+def test_main_import_reports_committed_records_on_failure(tmp_path, capsys):
+    # Arrange
+    data_path = str(tmp_path / "data.json")
+    people_path = tmp_path / "people.jsonl"
+    people_path.write_text("".join(json.dumps({"id": id}) + "\n" for id in ["1", "2", "3", "1"]), encoding="utf-8")
+
+    # Act
+    code = main(["import", "unemployed", str(people_path), "--chunk-size", "2", "--data", data_path])
+
+    # Assert
+    assert code == 1
+    assert "після 2 збережених записів" in capsys.readouterr().err
+    assert [p["id"] for p in JsonRepository(filepath=data_path).get_all("unemployed")] == ["1", "2"]
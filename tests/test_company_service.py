@@ -1,6 +1,8 @@
 import pytest
 from unittest.mock import MagicMock
 from bll.models import Company
+from bll.company_service import CompanyService
+from dal.repository import JsonRepository
 
 # --- CompanyService Tests (>= 50% Coverage) ---
 
@@ -55,4 +57,56 @@ def test_company_find_by_name(company_service, mock_repo):
     
     # Assert
     assert len(results) == 1
-    assert results[0].name == "Alpha Inc"
\ No newline at end of file
+    assert results[0].name == "Alpha Inc"
+
+def test_company_add_many_single_repository_call(company_service, mock_repo):
+    # Arrange
+    companies = [Company(name="Alpha"), Company(name="Beta")]
+
+    # Act
+    company_service.add_many(companies)
+
+    # Assert
+    mock_repo.add_many.assert_called_once()
+    added_data = mock_repo.add_many.call_args[0][1]
+    assert [c['name'] for c in added_data] == ["Alpha", "Beta"]
+    mock_repo.add.assert_not_called()
+
+def test_company_delete_many(company_service, mock_repo):
+    # Act
+    company_service.delete_many(["1", "2"])
+
+    # Assert
+    mock_repo.delete_many.assert_called_once_with("companies", ["1", "2"])
+
+def test_company_name_index_updates_incrementally(tmp_path):
+    # Arrange
+    repo = JsonRepository(filepath=str(tmp_path / "data.json"), use_cache=True)
+    service = CompanyService(repo)
+    service.add(Company(id="1", name="Alpha Inc"))
+    assert [c.id for c in service.find_by_name("alpha")] == ["1"]
+
+    # Act
+    service.add(Company(id="2", name="Alphabet"))
+    service.update(Company(id="1", name="Beta LLC"))
+
+    # Assert
+    assert [c.id for c in service.find_by_name("alpha")] == ["2"]
+    assert [c.id for c in service.find_by_name("beta")] == ["1"]
+    service.delete("2")
+    assert service.find_by_name("alpha") == []
+
+def test_company_get_many(company_service, mock_repo):
+    # Arrange
+    mock_repo.get_many.return_value = {
+        "1": {"id": "1", "name": "Alpha"},
+        "2": {"id": "2", "name": "Beta"}
+    }
+
+    # Act
+    companies = company_service.get_many(["1", "2", "missing"])
+
+    # Assert
+    mock_repo.get_many.assert_called_once_with("companies", ["1", "2", "missing"])
+    assert companies["2"].name == "Beta"
+    assert "missing" not in companies
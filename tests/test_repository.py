@@ -0,0 +1,395 @@
+import json
+import multiprocessing
+import os
+import threading
+import pytest
+from dal.locking import ReadWriteLock
+from dal.repository import JsonRepository
+
+# --- JsonRepository Tests ---
+
+@pytest.fixture
+def repo_path(tmp_path):
+    return str(tmp_path / "data.json")
+
+def test_repository_crud_roundtrip(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path)
+
+    # Act
+    repo.add("companies", {"id": "c1", "name": "Alpha"})
+    repo.add("companies", {"id": "c2", "name": "Beta"})
+    repo.update("companies", {"id": "c1", "name": "Alpha Updated"})
+    repo.delete("companies", "c2")
+
+    # Assert
+    assert repo.get_all("companies") == [{"id": "c1", "name": "Alpha Updated"}]
+    assert repo.get_by_id("companies", "c1")["name"] == "Alpha Updated"
+    with pytest.raises(FileNotFoundError):
+        repo.get_by_id("companies", "c2")
+
+def test_repository_cache_parses_once_per_change(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, use_cache=True)
+    repo.add("unemployed", {"id": "1", "name": "Іван"})
+    stats_before = repo.get_cache_stats()
+
+    # Act
+    for _ in range(4):
+        repo.get_all("unemployed")
+
+    # Assert
+    stats_after = repo.get_cache_stats()
+    assert stats_after["misses"] == stats_before["misses"]
+    assert stats_after["hits"] == stats_before["hits"] + 4
+
+def test_repository_cache_reloads_on_external_change(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, use_cache=True)
+    repo.get_all("companies")
+    misses_before = repo.get_cache_stats()["misses"]
+    other = JsonRepository(filepath=repo_path)
+
+    # Act
+    other.add("companies", {"id": "c1", "name": "Alpha"})
+    stat = os.stat(repo_path)
+    os.utime(repo_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    companies = repo.get_all("companies")
+
+    # Assert
+    assert companies == [{"id": "c1", "name": "Alpha"}]
+    assert repo.get_cache_stats()["misses"] == misses_before + 1
+
+def test_repository_get_all_returns_copy(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, use_cache=True)
+    repo.add("companies", {"id": "c1", "name": "Alpha"})
+
+    # Act
+    repo.get_all("companies").clear()
+
+    # Assert
+    assert len(repo.get_all("companies")) == 1
+    with open(repo_path, encoding="utf-8") as f:
+        assert len(json.load(f)["companies"]) == 1
+
+def test_repository_index_tracks_positions_after_delete(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, use_cache=True)
+    for i in range(5):
+        repo.add("vacancies", {"id": f"v{i}", "title": f"Vacancy {i}"})
+
+    # Act
+    repo.delete("vacancies", "v1")
+    repo.update("vacancies", {"id": "v3", "title": "Updated"})
+
+    # Assert
+    assert repo.get_by_id("vacancies", "v0")["title"] == "Vacancy 0"
+    assert repo.get_by_id("vacancies", "v3")["title"] == "Updated"
+    assert repo.get_by_id("vacancies", "v4")["title"] == "Vacancy 4"
+    assert [v["id"] for v in repo.get_all("vacancies")] == ["v0", "v2", "v3", "v4"]
+    with pytest.raises(FileNotFoundError):
+        repo.delete("vacancies", "v1")
+
+def test_repository_journal_replays_snapshot_and_log(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, journal=True)
+    repo.add("companies", {"id": "c1", "name": "Alpha"})
+    repo.add("companies", {"id": "c2", "name": "Beta"})
+    repo.update("companies", {"id": "c1", "name": "Alpha Updated"})
+    repo.delete("companies", "c2")
+
+    # Act
+    reopened = JsonRepository(filepath=repo_path, journal=True)
+
+    # Assert
+    with open(repo_path, encoding="utf-8") as f:
+        assert json.load(f)["companies"] == []
+    assert reopened.get_all("companies") == [{"id": "c1", "name": "Alpha Updated"}]
+
+def test_repository_journal_compacts_past_threshold(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, use_cache=True, journal=True, journal_threshold=200)
+
+    # Act
+    for i in range(10):
+        repo.add("unemployed", {"id": str(i), "name": f"Person {i}"})
+
+    # Assert
+    assert os.path.getsize(repo.journal_path) < 200
+    with open(repo_path, encoding="utf-8") as f:
+        assert len(json.load(f)["unemployed"]) >= 5
+    assert len(JsonRepository(filepath=repo_path, journal=True).get_all("unemployed")) == 10
+
+def test_repository_journal_replay_is_idempotent_after_interrupted_compaction(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, journal=True)
+    repo.add("companies", {"id": "c1", "name": "Alpha"})
+    repo._save_all(repo._load_all())
+    with open(repo.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "add", "collection": "comp')
+
+    # Act
+    companies = JsonRepository(filepath=repo_path, journal=True).get_all("companies")
+
+    # Assert
+    assert companies == [{"id": "c1", "name": "Alpha"}]
+
+def test_repository_journal_writes_after_torn_tail_survive_reopen(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, journal=True)
+    repo.add("companies", {"id": "1", "name": "Alpha"})
+    with open(repo.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "add", "collection": "companies", "entity": {"id": "x", "name": "Torn"}}')
+
+    # Act
+    reopened = JsonRepository(filepath=repo_path, journal=True)
+    reopened.add("companies", {"id": "2", "name": "Beta"})
+    reopened.add("companies", {"id": "3", "name": "Gamma"})
+
+    # Assert
+    ids = [c["id"] for c in JsonRepository(filepath=repo_path, journal=True).get_all("companies")]
+    assert ids == ["1", "2", "3"]
+
+def test_repository_failed_compaction_keeps_journal(repo_path, monkeypatch):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, journal=True)
+    repo.add("companies", {"id": "1", "name": "Alpha"})
+
+    def fail(path, text):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("dal.repository.atomic_write_text", fail)
+
+    # Act
+    repo.compact()
+    monkeypatch.undo()
+
+    # Assert
+    assert os.path.getsize(repo.journal_path) > 0
+    assert JsonRepository(filepath=repo_path, journal=True).get_all("companies") == [{"id": "1", "name": "Alpha"}]
+
+def test_repository_save_replaces_file_atomically(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path)
+    repo.add("companies", {"id": "c1", "name": "Alpha"})
+
+    # Act
+    repo.add("companies", {"id": "c2", "name": "Beta"})
+
+    # Assert
+    leftovers = [name for name in os.listdir(os.path.dirname(repo_path)) if name.endswith(".tmp")]
+    assert leftovers == []
+    assert len(repo.get_all("companies")) == 2
+
+def test_repository_corrupted_file_is_not_read_as_empty(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path)
+    with open(repo_path, "w", encoding="utf-8") as f:
+        f.write('{"companies": [')
+
+    # Act & Assert
+    with pytest.raises(json.JSONDecodeError):
+        repo.add("companies", {"id": "c1", "name": "Alpha"})
+    with open(repo_path, encoding="utf-8") as f:
+        assert f.read() == '{"companies": ['
+
+def _add_companies(path, prefix, count):
+    repo = JsonRepository(filepath=path)
+    for i in range(count):
+        repo.add("companies", {"id": f"{prefix}-{i}", "name": prefix})
+
+def test_repository_writers_from_parallel_processes_are_serialized(repo_path):
+    # Arrange
+    JsonRepository(filepath=repo_path)
+    workers = [
+        multiprocessing.Process(target=_add_companies, args=(repo_path, f"p{n}", 15))
+        for n in range(4)
+    ]
+
+    # Act
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    # Assert
+    assert len(JsonRepository(filepath=repo_path).get_all("companies")) == 60
+
+def test_repository_batch_operations(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, use_cache=True, journal=True)
+    repo.add_many("unemployed", [{"id": str(i), "name": f"Person {i}"} for i in range(5)])
+
+    # Act
+    repo.update_many("unemployed", [{"id": "1", "name": "One"}, {"id": "3", "name": "Three"}])
+    repo.delete_many("unemployed", ["0", "4"])
+
+    # Assert
+    expected = [{"id": "1", "name": "One"}, {"id": "2", "name": "Person 2"}, {"id": "3", "name": "Three"}]
+    assert repo.get_all("unemployed") == expected
+    assert repo.get_by_id("unemployed", "3")["name"] == "Three"
+    assert JsonRepository(filepath=repo_path, journal=True).get_all("unemployed") == expected
+
+def test_repository_batch_fails_as_whole(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path)
+    repo.add_many("companies", [{"id": "c1", "name": "Alpha"}, {"id": "c2", "name": "Beta"}])
+
+    # Act & Assert
+    with pytest.raises(FileNotFoundError):
+        repo.update_many("companies", [{"id": "c1", "name": "Changed"}, {"id": "missing"}])
+    with pytest.raises(FileNotFoundError):
+        repo.delete_many("companies", ["c2", "missing"])
+    assert repo.get_all("companies") == [{"id": "c1", "name": "Alpha"}, {"id": "c2", "name": "Beta"}]
+
+def test_repository_find_by_field_follows_mutations(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, use_cache=True)
+    repo.add_many("vacancies", [
+        {"id": "v1", "company_id": "c1"},
+        {"id": "v2", "company_id": "c2"},
+        {"id": "v3", "company_id": "c1"}
+    ])
+    assert [v["id"] for v in repo.find_by_field("vacancies", "company_id", "c1")] == ["v1", "v3"]
+
+    # Act
+    repo.update("vacancies", {"id": "v2", "company_id": "c1"})
+    repo.delete("vacancies", "v1")
+    repo.add("vacancies", {"id": "v4", "company_id": "c1"})
+
+    # Assert
+    assert [v["id"] for v in repo.find_by_field("vacancies", "company_id", "c1")] == ["v2", "v3", "v4"]
+    assert repo.find_by_field("vacancies", "company_id", "c2") == []
+    repo.delete_many("vacancies", ["v3"])
+    assert [v["id"] for v in repo.find_by_field("vacancies", "company_id", "c1")] == ["v2", "v4"]
+
+def test_repository_get_many_skips_missing_ids(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, use_cache=True)
+    repo.add_many("companies", [{"id": "c1", "name": "Alpha"}, {"id": "c2", "name": "Beta"}])
+    misses = repo.get_cache_stats()["misses"]
+
+    # Act
+    companies = repo.get_many("companies", ["c2", "missing", "c1"])
+
+    # Assert
+    assert companies == {"c2": {"id": "c2", "name": "Beta"}, "c1": {"id": "c1", "name": "Alpha"}}
+    assert repo.get_cache_stats()["misses"] == misses
+
+
+@pytest.mark.parametrize("journal", [False, True])
+def test_repository_survives_concurrent_threads(repo_path, journal):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, use_cache=True, journal=journal)
+    writers, per_writer, rounds = 8, 20, 3
+    errors = []
+    done = threading.Event()
+
+    def write(n):
+        try:
+            for i in range(per_writer):
+                repo.add("unemployed", {"id": f"{n}-{i}", "round": 0})
+            for r in range(1, rounds + 1):
+                for i in range(per_writer):
+                    repo.update("unemployed", {"id": f"{n}-{i}", "round": r})
+        except Exception as e:
+            errors.append(e)
+
+    def read():
+        while not done.is_set():
+            for item in repo.get_all("unemployed"):
+                if repo.get_by_id("unemployed", item["id"])["id"] != item["id"]:
+                    errors.append(item["id"])
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(writers)]
+    readers = [threading.Thread(target=read) for _ in range(4)]
+
+    # Act
+    for thread in readers + threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    done.set()
+    for thread in readers:
+        thread.join()
+
+    # Assert
+    assert errors == []
+    for stored in (repo.get_all("unemployed"), JsonRepository(filepath=repo_path, journal=journal).get_all("unemployed")):
+        assert len(stored) == writers * per_writer
+        assert all(item["round"] == rounds for item in stored)
+
+def test_read_write_lock_allows_parallel_readers_and_exclusive_writer():
+    # Arrange
+    lock = ReadWriteLock()
+    both_reading = threading.Barrier(2, timeout=5)
+    events = []
+
+    def reader():
+        with lock.read():
+            both_reading.wait()
+            with lock.read():
+                events.append("read")
+
+    def writer():
+        with lock.write():
+            with lock.write(), lock.read():
+                events.append("write")
+
+    # Act
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    for thread in readers:
+        thread.start()
+    for thread in readers:
+        thread.join()
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    writer_thread.join(timeout=5)
+
+    # Assert
+    assert events == ["read", "read", "write"]
+    with lock.read(), pytest.raises(RuntimeError):
+        lock.acquire_write()
+
+@pytest.mark.parametrize("journal", [False, True])
+def test_repository_reads_parse_in_parallel(repo_path, journal):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, journal=journal)
+    repo.add("companies", {"id": "1", "name": "Alpha"})
+    inside = threading.Barrier(4, timeout=5)
+    read_file = repo._read_file
+    results = []
+
+    def slow_read_file():
+        inside.wait()
+        return read_file()
+
+    repo._read_file = slow_read_file
+    threads = [threading.Thread(target=lambda: results.append(repo.get_all("companies"))) for _ in range(4)]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert not inside.broken
+    assert results == [[{"id": "1", "name": "Alpha"}]] * 4
+
+def test_repository_cache_hits_skip_reload_lock(repo_path):
+    # Arrange
+    repo = JsonRepository(filepath=repo_path, use_cache=True, journal=True)
+    repo.add("companies", {"id": "1", "name": "Alpha"})
+    repo.get_all("companies")
+    results = []
+
+    # Act
+    with repo._reload_lock:
+        reader = threading.Thread(target=lambda: results.append(repo.get_by_id("companies", "1")))
+        reader.start()
+        reader.join(timeout=5)
+
+    # Assert
+    assert results == [{"id": "1", "name": "Alpha"}]
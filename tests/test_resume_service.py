@@ -32,9 +32,8 @@ def test_resume_add_validation_error(resume_service):
 
 def test_resume_get_for_unemployed(resume_service, mock_repo):
     # Arrange
-    mock_repo.get_all.return_value = [
+    mock_repo.find_by_field.return_value = [
         {"id": "r1", "title": "Dev 1", "unemployed_id": "p1", "qualifications": "", "skills_description": ""},
-        {"id": "r2", "title": "Dev 2", "unemployed_id": "p2", "qualifications": "", "skills_description": ""},
         {"id": "r3", "title": "Dev 3", "unemployed_id": "p1", "qualifications": "", "skills_description": ""}
     ]
     
@@ -42,6 +41,21 @@ def test_resume_get_for_unemployed(resume_service, mock_repo):
     results = resume_service.get_resumes_for_unemployed("p1")
     
     # Assert
+    mock_repo.find_by_field.assert_called_once_with("resumes", "unemployed_id", "p1")
     assert len(results) == 2
     assert results[0].title == "Dev 1"
-    assert results[1].title == "Dev 3"
\ No newline at end of file
+    assert results[1].title == "Dev 3"
+
+def test_resume_add_many_fails_as_whole(resume_service, unemployed_service, mock_repo):
+    # Arrange
+    person = Unemployed(id="1", name="Анна", surname="К", qualifications="SQL")
+    unemployed_service.get_by_id = MagicMock(return_value=person)
+    resumes = [
+        Resume(title="Analyst", unemployed_id="1"),
+        Resume(title="", unemployed_id="1")
+    ]
+
+    # Act & Assert
+    with pytest.raises(ValidationException):
+        resume_service.add_many(resumes)
+    mock_repo.add_many.assert_not_called()
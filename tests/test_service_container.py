@@ -0,0 +1,156 @@
+import threading
+from dataclasses import asdict
+from bll.models import Company, Resume, Unemployed
+from bll.service_container import ServiceContainer
+from dal.repository import JsonRepository
+from dal.sqlite_repository import SqliteRepository
+from pl.container import get_container
+
+# --- Service container Tests ---
+
+def test_container_is_built_once_across_threads(tmp_path):
+    # Arrange
+    path = str(tmp_path / "data.json")
+    containers = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        containers.append(get_container(path))
+
+    # Act
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert len(containers) == 8
+    assert all(container is containers[0] for container in containers)
+    assert containers[0].resume_service._unemployed_service is containers[0].unemployed_service
+
+def test_container_sees_external_writes(tmp_path):
+    # Arrange
+    path = str(tmp_path / "data.json")
+    container = get_container(path)
+    container.unemployed_service.add(Unemployed(id="1", name="Іван", qualifications="Python"))
+    assert container.unemployed_service.get_statistics()["total_unemployed"] == 1
+
+    # Act
+    JsonRepository(filepath=path).add("unemployed", asdict(Unemployed(id="2", name="Олена", qualifications="Go")))
+    container = get_container(path)
+
+    # Assert
+    assert container.unemployed_service.get_statistics()["total_unemployed"] == 2
+    assert [p.id for p in container.unemployed_service.find_by_keyword("олен")] == ["2"]
+
+def test_sqlite_refresh_resets_on_foreign_commit(tmp_path):
+    # Arrange
+    path = str(tmp_path / "data.db")
+    repo = SqliteRepository(filepath=path)
+    events = []
+
+    class Listener:
+        def on_change(self, collection, action, entities):
+            events.append(action)
+
+    listener = Listener()
+    repo.subscribe(listener.on_change)
+
+    def on_new_thread(action):
+        thread = threading.Thread(target=action)
+        thread.start()
+        thread.join()
+
+    # Act
+    on_new_thread(lambda: repo.add("unemployed", {"id": "1"}))
+    repo.refresh()
+    own_writes = list(events)
+    SqliteRepository(filepath=path).add("unemployed", {"id": "2"})
+    on_new_thread(repo.refresh)
+    repo.refresh()
+
+    # Assert
+    assert own_writes == ["add"]
+    assert events == ["add", "reset"]
+
+def test_index_load_does_not_drop_concurrent_write(tmp_path):
+    # Arrange
+    container = ServiceContainer.from_json(str(tmp_path / "data.json"))
+    service = container.company_service
+    service.add(Company(id="a", name="Alpha"))
+    store = service._entity_store
+    load = store._loader
+    loaded, resume = threading.Event(), threading.Event()
+
+    def slow_load():
+        entities = load()
+        loaded.set()
+        resume.wait(5)
+        return entities
+
+    store._loader = slow_load
+    results = []
+    searcher = threading.Thread(target=lambda: results.append([c.id for c in service.find_by_name("alp")]))
+
+    # Act
+    searcher.start()
+    loaded.wait(5)
+    service.add(Company(id="b", name="Alpine"))
+    resume.set()
+    searcher.join()
+
+    # Assert
+    assert results == [["a", "b"]]
+
+def test_shared_services_survive_concurrent_sessions(tmp_path):
+    # Arrange
+    container = ServiceContainer.from_json(str(tmp_path / "data.json"))
+    people = container.unemployed_service
+    vacancies = container.vacancy_service
+    errors = []
+    done = threading.Event()
+
+    def write(n):
+        try:
+            for i in range(30):
+                people.add(Unemployed(id=f"{n}-{i}", name=f"Особа {n}", qualifications="Python, SQL"))
+                if i % 3 == 0:
+                    people.delete(f"{n}-{i}")
+        except Exception as e:
+            errors.append(e)
+
+    def read():
+        try:
+            while not done.is_set():
+                people.find_by_keyword("особа")
+                people.find_by_qualification("pyth")
+                list(people.query(sort_by="surname", limit=10))
+                people.get_statistics()
+                vacancies.find_matches_for_resume(Resume(qualifications="Python"), limit=5)
+                vacancies.get_match_cache_stats()
+        except Exception as e:
+            errors.append(e)
+
+    writers = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+    readers = [threading.Thread(target=read) for _ in range(4)]
+
+    # Act
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    done.set()
+    for thread in readers:
+        thread.join()
+
+    # Assert
+    expected = sorted(p["id"] for p in container.repository.get_all("unemployed"))
+    assert errors == []
+    assert len(expected) == 80
+    assert sorted(p.id for p in people.find_by_keyword("особа")) == expected
+    assert sorted(p.id for p in people.query(sort_by="surname")) == expected
+    assert people.count() == 80
+    assert people.get_statistics()["total_unemployed"] == 80
+    assert people.recompute_statistics() is True
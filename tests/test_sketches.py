@@ -0,0 +1,92 @@
+import random
+from collections import Counter
+import pytest
+from bll.sketches import CountMinSketch, SpaceSaving, SkillSketch
+
+# --- Sketch Tests ---
+
+def _zipf_stream(size, vocabulary, seed):
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(vocabulary)]
+    return rng.choices([f"skill{i}" for i in range(vocabulary)], weights=weights, k=size)
+
+def test_space_saving_is_exact_below_capacity():
+    # Arrange
+    sketch = SpaceSaving(capacity=10)
+
+    # Act
+    sketch.update(["python", "sql", "python", "go"])
+
+    # Assert
+    assert sketch.top_k(1) == [("python", 2)]
+    assert sketch.count("sql") == 1
+    assert sketch.error("python") == 0
+
+def test_space_saving_respects_error_bound_and_merges():
+    # Arrange
+    stream = _zipf_stream(20_000, 500, seed=1)
+    exact = Counter(stream)
+    shards = [SpaceSaving(capacity=100) for _ in range(4)]
+    for i, item in enumerate(stream):
+        shards[i % 4].add(item)
+
+    # Act
+    merged = shards[0]
+    for shard in shards[1:]:
+        merged.merge(shard)
+
+    # Assert
+    assert merged.total == len(stream)
+    assert len(merged.top_k(1000)) <= 100
+    for item, count in merged.top_k(10):
+        assert exact[item] <= count <= exact[item] + merged.error_bound() * 4
+        assert count - merged.error(item) <= exact[item]
+    assert [item for item, _ in merged.top_k(3)] == [item for item, _ in exact.most_common(3)]
+
+def test_count_min_sketch_overestimates_within_bound_and_merges():
+    # Arrange
+    stream = _zipf_stream(20_000, 500, seed=2)
+    exact = Counter(stream)
+    left, right = CountMinSketch(epsilon=0.01, delta=0.01), CountMinSketch(epsilon=0.01, delta=0.01)
+    for i, item in enumerate(stream):
+        (left if i % 2 else right).add(item)
+
+    # Act
+    left.merge(right)
+
+    # Assert
+    errors = [left.estimate(item) - count for item, count in exact.items()]
+    assert min(errors) >= 0
+    assert sum(error > left.error_bound() for error in errors) <= len(errors) * 0.01 + 1
+    with pytest.raises(ValueError):
+        left.merge(CountMinSketch(epsilon=0.1))
+
+def test_unemployed_approximate_statistics(unemployed_service, mock_repo):
+    # Arrange
+    mock_repo.iter_chunks.return_value = iter([
+        [{"id": "1", "qualifications": "Python, SQL"}, {"id": "2", "qualifications": "python, Docker"}],
+        [{"id": "3", "qualifications": "Python"}],
+    ])
+
+    # Act
+    stats = unemployed_service.get_approximate_statistics(top_k=1, epsilon=0.01)
+
+    # Assert
+    mock_repo.get_all.assert_not_called()
+    assert stats["total_unemployed"] == 3
+    assert stats["top_qualification"] == "python"
+    assert stats["top_skills"] == [("python", 3)]
+    assert stats["error_bound"] == pytest.approx(0.05)
+
+def test_skill_sketch_merges_shards():
+    # Arrange
+    left, right = SkillSketch(epsilon=0.1), SkillSketch(epsilon=0.1)
+    left.add({"python", "sql"})
+    right.add({"python"})
+
+    # Act
+    merged = left.merge(right)
+
+    # Assert
+    assert merged.documents == 2
+    assert merged.top_k(1) == [("python", 2)]
@@ -0,0 +1,150 @@
+import json
+import sqlite3
+import pytest
+from dal.repository import JsonRepository
+from dal.sqlite_repository import SqliteRepository, migrate_json_to_sqlite
+
+# --- SqliteRepository Tests ---
+
+@pytest.fixture
+def sqlite_repo(tmp_path):
+    return SqliteRepository(filepath=str(tmp_path / "data.db"))
+
+def test_sqlite_crud_roundtrip(sqlite_repo):
+    # Arrange
+    sqlite_repo.add("vacancies", {"id": "v1", "title": "Dev", "company_id": "c1"})
+    sqlite_repo.add("vacancies", {"id": "v2", "title": "QA", "company_id": "c2"})
+
+    # Act
+    sqlite_repo.update("vacancies", {"id": "v1", "title": "Senior Dev", "company_id": "c1"})
+    sqlite_repo.delete("vacancies", "v2")
+
+    # Assert
+    assert sqlite_repo.get_all("vacancies") == [{"id": "v1", "title": "Senior Dev", "company_id": "c1"}]
+    assert sqlite_repo.get_by_id("vacancies", "v1")["title"] == "Senior Dev"
+    with pytest.raises(FileNotFoundError):
+        sqlite_repo.get_by_id("vacancies", "v2")
+    with pytest.raises(FileNotFoundError):
+        sqlite_repo.update("vacancies", {"id": "missing"})
+    with pytest.raises(FileNotFoundError):
+        sqlite_repo.delete("vacancies", "missing")
+
+def test_sqlite_uses_wal_and_indexes(sqlite_repo):
+    # Arrange
+    conn = sqlite3.connect(sqlite_repo.filepath)
+
+    # Act
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list(resumes)")}
+
+    # Assert
+    assert journal_mode == "wal"
+    assert {"idx_resumes_id", "idx_resumes_unemployed_id"} <= indexes
+
+def test_migrate_json_to_sqlite(tmp_path):
+    # Arrange
+    json_path = tmp_path / "data.json"
+    json_path.write_text(json.dumps({
+        "unemployed": [{"id": "1", "name": "Іван", "surname": "А", "qualifications": "Python"}],
+        "companies": [{"id": "c1", "name": "Alpha"}],
+        "vacancies": [],
+        "resumes": [{"id": "r1", "title": "Dev", "unemployed_id": "1", "qualifications": "Python", "skills_description": ""}]
+    }, ensure_ascii=False), encoding="utf-8")
+    db_path = str(tmp_path / "data.db")
+
+    # Act
+    counts = migrate_json_to_sqlite(str(json_path), db_path)
+
+    # Assert
+    repo = SqliteRepository(filepath=db_path)
+    assert counts == {
+        "unemployed": {"migrated": 1, "duplicates": 0},
+        "companies": {"migrated": 1, "duplicates": 0},
+        "vacancies": {"migrated": 0, "duplicates": 0},
+        "resumes": {"migrated": 1, "duplicates": 0}
+    }
+    assert repo.get_by_id("unemployed", "1")["name"] == "Іван"
+    assert repo.get_all("resumes")[0]["unemployed_id"] == "1"
+
+def test_migrate_reports_duplicate_ids(tmp_path):
+    # Arrange
+    json_path = tmp_path / "data.json"
+    json_path.write_text(json.dumps({
+        "companies": [{"id": "c1", "name": "Alpha"}, {"id": "c2", "name": "Beta"}, {"id": "c1", "name": "Gamma"}]
+    }), encoding="utf-8")
+    db_path = str(tmp_path / "data.db")
+
+    # Act
+    counts = migrate_json_to_sqlite(str(json_path), db_path)
+
+    # Assert
+    assert counts["companies"] == {"migrated": 2, "duplicates": 1}
+    assert SqliteRepository(filepath=db_path).get_by_id("companies", "c1")["name"] == "Alpha"
+
+@pytest.mark.parametrize("make_repo", [
+    lambda tmp_path: SqliteRepository(filepath=str(tmp_path / "data.db")),
+    lambda tmp_path: JsonRepository(filepath=str(tmp_path / "data.json"), journal=True),
+])
+def test_repositories_reject_duplicate_ids_alike(tmp_path, make_repo):
+    # Arrange
+    repo = make_repo(tmp_path)
+    repo.add("companies", {"id": "c1", "name": "Alpha"})
+
+    # Act & Assert
+    with pytest.raises(FileExistsError):
+        repo.add("companies", {"id": "c1", "name": "Beta"})
+    with pytest.raises(FileExistsError):
+        repo.add_many("companies", [{"id": "c2", "name": "Beta"}, {"id": "c2", "name": "Gamma"}])
+    assert repo.get_all("companies") == [{"id": "c1", "name": "Alpha"}]
+
+@pytest.mark.parametrize("make_repo", [
+    lambda tmp_path: SqliteRepository(filepath=str(tmp_path / "data.db")),
+    lambda tmp_path: JsonRepository(filepath=str(tmp_path / "data.json")),
+])
+def test_repositories_iterate_in_fixed_size_chunks(tmp_path, make_repo):
+    # Arrange
+    repo = make_repo(tmp_path)
+    repo.add_many("companies", [{"id": f"c{i}", "name": f"Company {i}"} for i in range(5)])
+
+    # Act
+    chunks = list(repo.iter_chunks("companies", 2))
+
+    # Assert
+    assert [[item["id"] for item in chunk] for chunk in chunks] == [["c0", "c1"], ["c2", "c3"], ["c4"]]
+    assert list(repo.iter_chunks("missing", 2)) == []
+
+def test_sqlite_batch_rolls_back_on_missing_id(sqlite_repo):
+    # Arrange
+    sqlite_repo.add_many("companies", [{"id": "c1", "name": "Alpha"}, {"id": "c2", "name": "Beta"}])
+
+    # Act & Assert
+    with pytest.raises(FileNotFoundError):
+        sqlite_repo.delete_many("companies", ["c1", "missing"])
+    assert len(sqlite_repo.get_all("companies")) == 2
+
+def test_sqlite_find_by_field(sqlite_repo):
+    # Arrange
+    sqlite_repo.add_many("resumes", [
+        {"id": "r1", "unemployed_id": "p1", "title": "A"},
+        {"id": "r2", "unemployed_id": "p2", "title": "B"},
+        {"id": "r3", "unemployed_id": "p1", "title": "A"}
+    ])
+
+    # Act
+    by_column = sqlite_repo.find_by_field("resumes", "unemployed_id", "p1")
+    by_json = sqlite_repo.find_by_field("resumes", "title", "A")
+
+    # Assert
+    assert [r["id"] for r in by_column] == ["r1", "r3"]
+    assert [r["id"] for r in by_json] == ["r1", "r3"]
+
+def test_sqlite_get_many(sqlite_repo):
+    # Arrange
+    sqlite_repo.add_many("companies", [{"id": f"c{i}", "name": str(i)} for i in range(1000)])
+
+    # Act
+    companies = sqlite_repo.get_many("companies", [f"c{i}" for i in range(1000)] + ["missing"])
+
+    # Assert
+    assert len(companies) == 1000
+    assert companies["c999"]["name"] == "999"
@@ -1,7 +1,13 @@
 import pytest
+import random
+from collections import Counter
 from unittest.mock import MagicMock
-from bll.models import Unemployed
+from dataclasses import asdict
+from bll.models import Unemployed, parse_skill_list, parse_skills
 from bll.exceptions import EntityNotFoundException, ValidationException
+from bll.unemployed_service import UnemployedService
+from bll.columnar_store import ColumnarStore
+from dal.repository import JsonRepository
 
 # --- UnemployedService Tests (100% Coverage) ---
 
@@ -116,4 +122,192 @@ def test_unemployed_get_statistics(unemployed_service, mock_repo):
     
     # Assert
     assert stats["total_unemployed"] == 3
-    assert stats["top_qualification"] in ["python", "sql"]
\ No newline at end of file
+    assert stats["top_qualification"] == "python"
+
+@pytest.mark.parametrize("qualifications", [
+    ["Python, SQL, Git"],
+    ["Python,SQL", "SQL", "Python"],
+    ["Git, Git, SQL", "sql, git"],
+])
+def test_unemployed_top_qualification_ties_follow_first_seen(unemployed_service, mock_repo, qualifications):
+    # Arrange
+    mock_repo.get_all.return_value = [{"id": str(i), "qualifications": q} for i, q in enumerate(qualifications)]
+    listed = [s.strip().lower() for q in qualifications for s in q.split(",") if s.strip()]
+    counts = Counter(skill for q in qualifications for skill in parse_skill_list(q))
+
+    # Act
+    stats = unemployed_service.get_statistics()
+
+    # Assert
+    assert stats["top_qualification"] == counts.most_common(1)[0][0] == listed[0]
+
+def test_unemployed_skills_cached_until_qualifications_change():
+    # Arrange
+    person = Unemployed(name="Іван", qualifications=" Python, SQL ,python")
+
+    # Act
+    first = person.skills
+    second = person.skills
+    person.qualifications = "Java"
+
+    # Assert
+    assert first == frozenset({"python", "sql"})
+    assert first is second
+    assert person.skills == frozenset({"java"})
+    assert "_skills_cache" not in asdict(person)
+
+def test_unemployed_keyword_search_matches_substring_semantics(unemployed_service, mock_repo):
+    # Arrange
+    records = [
+        {"id": "1", "name": "Іван", "surname": "Петренко", "qualifications": "Python, SQL"},
+        {"id": "2", "name": "Петро", "surname": "Іваненко", "qualifications": "Java"},
+        {"id": "3", "name": "Олена", "surname": "Ко", "qualifications": "PostgreSQL"}
+    ]
+    mock_repo.get_all.return_value = records
+
+    # Act & Assert
+    for query in ["ів", "іван", "ЕНКО", "ко", "xyz", "о"]:
+        expected = [r["id"] for r in records if query.lower() in r["name"].lower() or query.lower() in r["surname"].lower()]
+        assert [p.id for p in unemployed_service.find_by_keyword(query)] == expected
+    for query in ["sql", "SQL, ", "ja", "postgres"]:
+        expected = [r["id"] for r in records if query.lower() in r["qualifications"].lower()]
+        assert [p.id for p in unemployed_service.find_by_qualification(query)] == expected
+
+def test_unemployed_query_pages_in_sorted_order(tmp_path):
+    # Arrange
+    repo = JsonRepository(filepath=str(tmp_path / "data.json"), use_cache=True)
+    service = UnemployedService(repo)
+    surnames = ["Коваль", "Андрієнко", "Шевченко", "Бондар", "Мельник"]
+    service.add_many([Unemployed(id=str(i), surname=s, qualifications="Python" if i % 2 else "Java") for i, s in enumerate(surnames)])
+
+    # Act
+    first_page = list(service.query(sort_by="surname", limit=2))
+    second_page = list(service.query(sort_by="surname", limit=2, offset=2))
+    service.add(Unemployed(id="5", surname="Бабенко"))
+    service.delete("0")
+    after_changes = [p.surname for p in service.query(sort_by="surname")]
+    python_only = [p.surname for p in service.query(sort_by="surname", where=lambda p: "python" in p.skills, limit=1, offset=1)]
+
+    # Assert
+    assert [p.surname for p in first_page] == ["Андрієнко", "Бондар"]
+    assert [p.surname for p in second_page] == ["Коваль", "Мельник"]
+    assert after_changes == ["Андрієнко", "Бабенко", "Бондар", "Мельник", "Шевченко"]
+    assert python_only == ["Бондар"]
+    assert service.count() == 5
+
+def test_unemployed_statistics_follow_mutations_without_models(tmp_path):
+    # Arrange
+    repo = JsonRepository(filepath=str(tmp_path / "data.json"), use_cache=True)
+    service = UnemployedService(repo)
+    service.add_many([Unemployed(id="1", qualifications="Python, SQL"), Unemployed(id="2", qualifications="Java")])
+    service.get_statistics()
+
+    # Act
+    service.add(Unemployed(id="3", qualifications="java, Docker"))
+    service.update(Unemployed(id="1", qualifications="Go"))
+    service.delete("2")
+    stats = service.get_statistics()
+
+    # Assert
+    assert stats["total_unemployed"] == 2
+    assert service._columns.skill_counts() == {"go": 1, "java": 1, "docker": 1}
+    assert service._columns.ids_where("name", "") == ["1", "3"]
+    assert [id for id, _ in service._columns.match(frozenset({"go", "java"}), min_match=0.5)] == ["1", "3"]
+
+def test_columnar_store_matches_and_compacts():
+    # Arrange
+    records = [{"id": str(i), "company_id": f"c{i % 3}", "qualifications": "Python, SQL" if i % 2 else "Java"} for i in range(3000)]
+    store = ColumnarStore(lambda: records, ["company_id"])
+    store.count()
+
+    # Act
+    store.apply_change("delete", records[:2000])
+    matches = store.match(frozenset({"python", "git"}), min_match=0.5)
+
+    # Assert
+    assert store.count() == 1000
+    assert store._dead == 0
+    assert store.value_counts("company_id") == Counter(r["company_id"] for r in records[2000:])
+    assert [id for id, _ in matches] == [r["id"] for r in records[2000:] if int(r["id"]) % 2]
+    assert all(score == 0.5 for _, score in matches)
+
+def test_columnar_store_recompute_detects_drift():
+    # Arrange
+    records = [{"id": "1", "qualifications": "Python"}, {"id": "2", "qualifications": "Python, SQL"}]
+    store = ColumnarStore(lambda: list(records), [])
+    store.apply_change("update", [{"id": "2", "qualifications": "SQL"}])
+    records[1] = {"id": "2", "qualifications": "SQL"}
+    consistent = store.recompute()
+
+    # Act
+    records.append({"id": "3", "qualifications": "Go"})
+    drifted = store.recompute()
+
+    # Assert
+    assert consistent is True
+    assert drifted is False
+    assert store.skill_counts() == {"python": 1, "sql": 1, "go": 1}
+
+def test_unemployed_sorted_rebuild_sorts_once(unemployed_service, mock_repo, monkeypatch):
+    # Arrange
+    mock_repo.get_all.return_value = [{"id": str(i), "surname": f"s{(i * 7919) % 1000:03d}"} for i in range(1000)]
+
+    def fail_insort(*args):
+        raise AssertionError("rebuild must not insert keys one by one")
+
+    monkeypatch.setattr("bll.sorted_index.insort", fail_insort)
+
+    # Act
+    page = [p.surname for p in unemployed_service.query(sort_by="surname", limit=3)]
+    unemployed_service._on_repository_change(None, "reset", [])
+    reloaded = [p.surname for p in unemployed_service.query(sort_by="surname", limit=3)]
+
+    # Assert
+    assert page == reloaded == ["s000", "s001", "s002"]
+
+def test_unemployed_indexes_share_one_entity_per_record(tmp_path):
+    # Arrange
+    repo = JsonRepository(filepath=str(tmp_path / "data.json"), use_cache=True)
+    service = UnemployedService(repo)
+    service.add(Unemployed(id="1", name="Іван", surname="Коваль", qualifications="Python"))
+
+    # Act
+    by_name = service.find_by_keyword("іва")
+    by_skill = service.find_by_qualification("pyth")
+    by_surname = list(service.query(sort_by="surname"))
+    by_insertion = list(service.query())
+    service.update(Unemployed(id="1", name="Іван", surname="Коваль", qualifications="Go"))
+
+    # Assert
+    assert by_name[0] is by_skill[0] is by_surname[0] is by_insertion[0]
+    assert service.find_by_qualification("pyth") == []
+    assert [p.qualifications for p in service.find_by_qualification("go")] == ["Go"]
+    assert service.count() == 1
+    assert len(service._entity_store._indexes) == 4
+
+def test_columnar_store_tracks_top_skill_through_random_changes():
+    # Arrange
+    rng = random.Random(7)
+    skills = ["python", "sql", "go", "java", "docker"]
+    store = ColumnarStore(lambda: [], [])
+    store.count()
+    live = {}
+    first_seen = []
+
+    # Act & Assert
+    for step in range(2000):
+        id = str(rng.randrange(60))
+        if id in live and rng.random() < 0.4:
+            store.apply_change("delete", [{"id": id}])
+            del live[id]
+        else:
+            live[id] = ", ".join(rng.sample(skills, rng.randint(0, 3)))
+            store.apply_change("update", [{"id": id, "qualifications": live[id]}])
+            first_seen.extend(skill for skill in live[id].split(", ") if skill and skill not in first_seen)
+        expected = Counter(skill for q in live.values() for skill in parse_skills(q))
+        top = store.top_skill()
+        if expected:
+            assert top[1] == max(expected.values())
+            assert top[0] == min((s for s, n in expected.items() if n == top[1]), key=first_seen.index)
+        else:
+            assert top is None
@@ -1,6 +1,10 @@
 import pytest
+from dataclasses import asdict
 from unittest.mock import MagicMock
 from bll.models import Vacancy, Resume
+from bll.vacancy_service import VacancyService
+from bll.matching_engine import ShardedScorer
+from dal.repository import JsonRepository
 
 # --- VacancyService Tests (>= 50% Coverage) ---
 
@@ -18,9 +22,8 @@ def test_vacancy_add_success(vacancy_service, mock_repo):
 
 def test_vacancy_get_for_company(vacancy_service, mock_repo):
     # Arrange
-    mock_repo.get_all.return_value = [
+    mock_repo.find_by_field.return_value = [
         {"id": "v1", "title": "Dev 1", "company_id": "c1", "qualifications": "", "description": ""},
-        {"id": "v2", "title": "Dev 2", "company_id": "c2", "qualifications": "", "description": ""},
         {"id": "v3", "title": "Dev 3", "company_id": "c1", "qualifications": "", "description": ""}
     ]
     
@@ -28,6 +31,7 @@ def test_vacancy_get_for_company(vacancy_service, mock_repo):
     results = vacancy_service.get_vacancies_for_company("c1")
     
     # Assert
+    mock_repo.find_by_field.assert_called_once_with("vacancies", "company_id", "c1")
     assert len(results) == 2
     assert results[0].title == "Dev 1"
     assert results[1].title == "Dev 3"
@@ -50,4 +54,257 @@ def test_vacancy_matching(vacancy_service, mock_repo):
     assert matches[0]["vacancy"].title == "Python Dev"
     assert matches[0]["score"] == 1.0
     assert matches[1]["vacancy"].title == "Data Analyst"
-    assert matches[1]["score"] == (2/3)
\ No newline at end of file
+    assert matches[1]["score"] == (2/3)
+
+def test_vacancy_matching_index_follows_repository_changes(tmp_path):
+    # Arrange
+    repo = JsonRepository(filepath=str(tmp_path / "data.json"), use_cache=True)
+    service = VacancyService(repo)
+    service.add(Vacancy(id="v1", title="Python Dev", qualifications="Python, SQL"))
+    resume = Resume(qualifications="Python, Docker")
+    assert [m["vacancy"].id for m in service.find_matches_for_resume(resume)] == ["v1"]
+
+    # Act
+    service.add(Vacancy(id="v2", title="DevOps", qualifications="Docker"))
+    service.update(Vacancy(id="v1", title="Java Dev", qualifications="Java"))
+    repo.add("resumes", {"id": "r1", "title": "Ops", "unemployed_id": "p1", "qualifications": "docker", "skills_description": ""})
+
+    # Assert
+    matches = service.find_matches_for_resume(resume)
+    assert [(m["vacancy"].id, m["score"]) for m in matches] == [("v2", 0.5)]
+    reverse = service.find_matches_for_vacancy(Vacancy(qualifications="Docker, Kubernetes"))
+    assert [(m["resume"].id, m["score"]) for m in reverse] == [("r1", 0.5)]
+
+    service.delete("v2")
+    assert service.find_matches_for_resume(resume) == []
+
+def test_vacancy_matching_with_zero_threshold_keeps_all(vacancy_service):
+    # Arrange
+    vacancy_service.get_all = MagicMock(return_value=[
+        Vacancy(id="v1", qualifications="Python"),
+        Vacancy(id="v2", qualifications="Java")
+    ])
+
+    # Act
+    matches = vacancy_service.find_matches_for_resume(Resume(qualifications="Python"), min_match=0)
+
+    # Assert
+    assert [(m["vacancy"].id, m["score"]) for m in matches] == [("v1", 1.0), ("v2", 0.0)]
+
+def test_vacancy_batch_matching_equals_pairwise_scores(vacancy_service):
+    # Arrange
+    vacancies = [
+        Vacancy(id="v1", qualifications="Python, SQL, Git"),
+        Vacancy(id="v2", qualifications="SQL, Python, Pandas"),
+        Vacancy(id="v3", qualifications="JavaScript, React")
+    ]
+    resumes = [
+        Resume(id="r1", qualifications="Python, SQL"),
+        Resume(id="r2", qualifications="React, Python, Go"),
+        Resume(id="r3", qualifications="")
+    ]
+
+    # Act
+    forward = vacancy_service.match_all_resumes(resumes, vacancies, min_match=0.01)
+    reverse = vacancy_service.match_all_vacancies(vacancies, resumes, min_match=0.01, top_k=1)
+
+    # Assert
+    for resume in resumes:
+        pairwise = [
+            (v.id, vacancy_service._calculate_match_score(v.qualifications, resume.qualifications))
+            for v in vacancies
+        ]
+        pairwise = sorted([p for p in pairwise if p[1] >= 0.01], key=lambda p: p[1], reverse=True)
+        assert [(m["vacancy"].id, m["score"]) for m in forward[resume.id]] == pairwise
+    assert [(m["resume"].id, m["score"]) for m in reverse["v1"]] == [("r1", 2/3)]
+    assert reverse["v3"][0]["score"] == vacancy_service._calculate_reverse_match_score("JavaScript, React", "React, Python, Go")
+
+def test_sparse_counts_match_posting_counts():
+    # Arrange
+    pytest.importorskip("scipy")
+    from bll.matching_engine import _sparse_counts, _posting_counts
+    rows = [frozenset({"python", "sql"}), frozenset(), frozenset({"go"})]
+    columns = [frozenset({"sql"}), frozenset({"python", "sql", "git"}), frozenset({"rust"})]
+
+    # Act & Assert
+    assert list(_sparse_counts(rows, columns)) == list(_posting_counts(rows, columns))
+    assert list(_sparse_counts(rows, columns, block_rows=2)) == list(_posting_counts(rows, columns))
+
+def test_vacancy_batch_matching_backends(mock_repo, monkeypatch):
+    # Arrange
+    vacancies = [Vacancy(id="v1", qualifications="Python, SQL"), Vacancy(id="v2", qualifications="Go")]
+    resumes = [Resume(id="r1", qualifications="Python"), Resume(id="r2", qualifications="Go, SQL")]
+    auto = VacancyService(mock_repo)
+    postings = VacancyService(mock_repo, matching_backend="postings")
+    monkeypatch.setattr("bll.matching_engine.sparse", None)
+
+    # Act
+    expected = auto.match_all_resumes(resumes, vacancies)
+    actual = postings.match_all_resumes(resumes, vacancies)
+
+    # Assert
+    assert {id: [(m["vacancy"].id, m["score"]) for m in matches] for id, matches in actual.items()} == \
+        {id: [(m["vacancy"].id, m["score"]) for m in matches] for id, matches in expected.items()}
+    with pytest.raises(ImportError):
+        VacancyService(mock_repo, matching_backend="sparse").match_all_resumes(resumes, vacancies)
+    with pytest.raises(ValueError):
+        VacancyService(mock_repo, matching_backend="dense").match_all_resumes(resumes, vacancies)
+
+def test_vacancy_matching_pagination(vacancy_service):
+    # Arrange
+    vacancy_service.get_all = MagicMock(return_value=[
+        Vacancy(id=f"v{i}", qualifications=", ".join(["Python"] + [f"s{j}" for j in range(i)]))
+        for i in range(6)
+    ])
+    resume = Resume(qualifications="Python, s0, s1, s2")
+    full = vacancy_service.find_matches_for_resume(resume)
+
+    # Act
+    pages = [vacancy_service.find_matches_for_resume(resume, limit=2, offset=offset) for offset in (0, 2, 4)]
+
+    # Assert
+    assert [m["vacancy"].id for page in pages for m in page] == [m["vacancy"].id for m in full]
+    assert all(len(page) <= 2 for page in pages)
+
+def test_vacancy_parallel_matching_equals_serial(tmp_path):
+    # Arrange
+    repo = JsonRepository(filepath=str(tmp_path / "data.json"), use_cache=True)
+    repo.add_many("resumes", [
+        asdict(Resume(id=f"r{i}", qualifications=", ".join(f"s{j}" for j in range(i % 5 + 1))))
+        for i in range(40)
+    ])
+    serial = VacancyService(repo)
+    parallel = VacancyService(repo, parallel_workers=2, parallel_threshold=10)
+    vacancy = Vacancy(qualifications="s0, s1, s2")
+
+    # Act
+    try:
+        expected = serial.find_matches_for_vacancy(vacancy, limit=7, offset=3)
+        expected_all = serial.find_matches_for_vacancy(vacancy, min_match=0)
+        actual = parallel.find_matches_for_vacancy(vacancy, limit=7, offset=3)
+        everything = parallel.find_matches_for_vacancy(vacancy, min_match=0)
+        scorer = parallel._residents["resumes"].scorer
+        repo.update("resumes", asdict(Resume(id="r0", qualifications="s0, s1, s2")))
+        repo.add("resumes", asdict(Resume(id="r40", qualifications="s0, s1, s2")))
+        refreshed = parallel.find_matches_for_vacancy(vacancy, limit=3)
+        refreshed_serial = serial.find_matches_for_vacancy(vacancy, limit=3)
+        kept = parallel._residents["resumes"].scorer
+        repo.delete_many("resumes", ["r2", "r3", "r4"])
+        trimmed = parallel.find_matches_for_vacancy(vacancy, limit=3)
+        rebuilt = parallel._residents["resumes"].scorer
+    finally:
+        parallel.close()
+
+    # Assert
+    assert [(m["resume"].id, m["score"]) for m in actual] == [(m["resume"].id, m["score"]) for m in expected]
+    assert [m["resume"].id for m in everything] == [m["resume"].id for m in expected_all]
+    assert [m["resume"].id for m in refreshed] == [m["resume"].id for m in refreshed_serial] == ["r0", "r2", "r3"]
+    assert kept is scorer
+    assert [m["resume"].id for m in trimmed] == ["r0", "r7", "r8"]
+    assert rebuilt is not scorer
+
+def test_vacancy_parallel_scoring_runs_outside_service_lock(tmp_path, monkeypatch):
+    # Arrange
+    repo = JsonRepository(filepath=str(tmp_path / "data.json"), use_cache=True)
+    repo.add_many("resumes", [asdict(Resume(id=f"r{i}", qualifications="s0")) for i in range(20)])
+    service = VacancyService(repo, parallel_workers=2, parallel_threshold=10)
+    held = []
+    original_score = ShardedScorer.score
+    monkeypatch.setattr(ShardedScorer, "score", lambda self, *args: held.append(service._residents_lock.locked()) or original_score(self, *args))
+
+    # Act
+    try:
+        matches = service.find_matches_for_vacancy(Vacancy(qualifications="s0"), limit=2)
+    finally:
+        service.close()
+
+    # Assert
+    assert [m["resume"].id for m in matches] == ["r0", "r1"]
+    assert held == [False]
+
+def test_vacancy_match_cache_invalidated_by_mutations(tmp_path):
+    # Arrange
+    repo = JsonRepository(filepath=str(tmp_path / "data.json"), use_cache=True)
+    service = VacancyService(repo)
+    service.add(Vacancy(id="v1", title="Python Dev", qualifications="Python"))
+    resume = Resume(id="r1", qualifications="Python")
+
+    # Act
+    first = service.find_matches_for_resume(resume)
+    second = service.find_matches_for_resume(resume)
+    service.add(Vacancy(id="v2", title="Backend", qualifications="Python, SQL"))
+    third = service.find_matches_for_resume(resume)
+
+    # Assert
+    assert [m["vacancy"].id for m in first] == [m["vacancy"].id for m in second] == ["v1"]
+    assert [m["vacancy"].id for m in third] == ["v1", "v2"]
+    stats = service.get_match_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["hit_ratio"] == 1 / 3
+
+def test_vacancy_match_cache_keyed_by_stored_skills(tmp_path):
+    # Arrange
+    repo = JsonRepository(filepath=str(tmp_path / "data.json"), use_cache=True)
+    service = VacancyService(repo)
+    service.add(Vacancy(id="v1", title="Python Dev", qualifications="Python"))
+    service.add(Vacancy(id="v2", title="Java Dev", qualifications="Java"))
+    repo.add("resumes", {"id": "r1", "qualifications": "Ruby"})
+    first_copy = Resume(**repo.get_by_id("resumes", "r1"))
+    stale_copy = Resume(**repo.get_by_id("resumes", "r1"))
+
+    # Act
+    first_copy.qualifications = "Python"
+    repo.update("resumes", {**asdict(first_copy), "version": first_copy.version + 1})
+    before = service.find_matches_for_resume(Resume(**repo.get_by_id("resumes", "r1")))
+    stale_copy.qualifications = "Java"
+    repo.update("resumes", {**asdict(stale_copy), "version": stale_copy.version + 1})
+    after = service.find_matches_for_resume(Resume(**repo.get_by_id("resumes", "r1")))
+
+    # Assert
+    assert [m["vacancy"].id for m in before] == ["v1"]
+    assert [m["vacancy"].id for m in after] == ["v2"]
+
+def test_vacancy_update_bumps_version(vacancy_service, mock_repo):
+    # Arrange
+    vacancy = Vacancy(id="v1", title="Dev", version=2)
+
+    # Act
+    vacancy_service.update(vacancy)
+
+    # Assert
+    assert mock_repo.update.call_args[0][1]["version"] == 3
+    assert vacancy.version == 3
+
+def test_vacancy_ranked_search_weights_title(tmp_path):
+    # Arrange
+    repo = JsonRepository(filepath=str(tmp_path / "data.json"), use_cache=True)
+    service = VacancyService(repo)
+    service.add(Vacancy(id="v1", title="Менеджер", description="Робота з python скриптами"))
+    service.add(Vacancy(id="v2", title="Python розробник", qualifications="Python, Django"))
+    service.add(Vacancy(id="v3", title="Дизайнер", description="Figma"))
+
+    # Act
+    results = service.search_ranked("python")
+    service.update(Vacancy(id="v3", title="Python Designer", qualifications="Python"))
+    updated = service.search_ranked("python", limit=2)
+
+    # Assert
+    assert [m["vacancy"].id for m in results] == ["v2", "v1"]
+    assert results[0]["score"] > results[1]["score"] > 0
+    assert {m["vacancy"].id for m in updated} == {"v2", "v3"}
+
+def test_vacancy_counts_by_company_follow_writes(tmp_path):
+    # Arrange
+    service = VacancyService(JsonRepository(filepath=str(tmp_path / "data.json"), use_cache=True))
+    service.add_many([Vacancy(id=str(i), title="Dev", company_id="c1" if i < 3 else "c2") for i in range(5)])
+    service.count_vacancies_by_company()
+
+    # Act
+    service.update(Vacancy(id="0", title="Dev", company_id="c2"))
+    service.delete("4")
+    counts = service.count_vacancies_by_company()
+
+    # Assert
+    assert counts == {"c1": 2, "c2": 2}
+    assert service.recompute_statistics() is True